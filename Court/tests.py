@@ -333,8 +333,10 @@ class CourtViewTests(TestCase):
             self.client.get(reverse('Court:get_availability', args=[9999]), {'date': today}).status_code,
             404,
         )
+        # Unexpected errors are not swallowed; they reach Django's 500 handling.
         with patch('Court.views.Court.objects.get', side_effect=Exception('boom')):
-            self.assertEqual(self.client.get(url, {'date': today}).status_code, 500)
+            with self.assertRaisesMessage(Exception, 'boom'):
+                self.client.get(url, {'date': today})
 
     def test_set_availability_flow_and_errors(self):
         url = reverse('Court:set_availability', args=[self.court.id])
@@ -390,7 +392,10 @@ class CourtViewTests(TestCase):
             ('missing-fields', {}, 400),
             ('invalid-date', {'court_id': self.court.id, 'date': 'bad'}, 400),
             ('not-found', {'court_id': 9999, 'date': today}, 404),
+            ('bad-court-id', {'court_id': 'abc', 'date': today}, 404),
+            ('non-string-date', {'court_id': self.court.id, 'date': 20240115}, 400),
             ('json-error', 'oops', 400),
+            ('json-not-object', '[1, 2]', 400),
         ]:
             with self.subTest(name=name):
                 response = self.client.post(
@@ -401,8 +406,8 @@ class CourtViewTests(TestCase):
                 self.assertEqual(response.status_code, status)
 
         with patch('Court.views.Court.objects.get', side_effect=Exception('boom')):
-            response = self.client.post(url, json.dumps(payload), content_type='application/json')
-            self.assertEqual(response.status_code, 500)
+            with self.assertRaisesMessage(Exception, 'boom'):
+                self.client.post(url, json.dumps(payload), content_type='application/json')
 
     def test_get_all_court(self):
         self.court.latitude = Decimal('1.234567')
@@ -477,8 +482,14 @@ class CourtViewTests(TestCase):
             self.client.post(url, json.dumps(dict(payload, court_id=9999)), content_type='application/json').status_code,
             404,
         )
+        self.assertEqual(self.client.post(url, 'oops', content_type='application/json').status_code, 400)
+        self.assertEqual(
+            self.client.post(url, json.dumps(dict(payload, court_id='abc')), content_type='application/json').status_code,
+            404,
+        )
         with patch('Court.views.Court.objects.get', side_effect=Exception('boom')):
-            self.assertEqual(self.client.post(url, json.dumps(payload), content_type='application/json').status_code, 500)
+            with self.assertRaisesMessage(Exception, 'boom'):
+                self.client.post(url, json.dumps(payload), content_type='application/json')
 
     def test_delete_court(self):
         url = reverse('Court:delete_court', args=[self.court.id])
@@ -16,6 +16,12 @@ from Auth_Profile.models import User as ProfileUser
 from .forms import CourtForm, sanitize_phone_input
 from .models import Court, TimeSlot
 
+# Static error payloads: built once and never carry exception text. Views
+# only catch the errors they expect; anything else propagates to Django's
+# 500 handling so it is logged instead of being hidden behind a JSON body.
+_COURT_NOT_FOUND = {'success': False, 'error': 'Court not found'}
+_INVALID_METHOD = {'success': False, 'error': 'Invalid request method'}
+
 
 def clean_decimal(value, default=None, min_value=None, max_value=None):
     """
@@ -508,7 +514,7 @@ def get_court_detail(request, court_id):
         }
         return JsonResponse({'court': data})
     except Court.DoesNotExist:
-        return JsonResponse({'error': 'Court not found'}, status=404)
+        return JsonResponse(_COURT_NOT_FOUND, status=404)
 
 
 @require_http_methods(["POST"])
@@ -555,9 +561,7 @@ def get_availability(request, court_id):
     except ValueError:
         return JsonResponse({'error': 'Invalid date format. Use YYYY-MM-DD'}, status=400)
     except Court.DoesNotExist:
-        return JsonResponse({'error': 'Court not found'}, status=404)
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=500)
+        return JsonResponse(_COURT_NOT_FOUND, status=404)
 
 
 @require_http_methods(["POST"])
@@ -628,6 +632,11 @@ def create_booking(request):
     try:
         # Parse JSON body
         data = json.loads(request.body)
+        if not isinstance(data, dict):
+            return JsonResponse({
+                'success': False,
+                'message': 'Invalid JSON'
+            }, status=400)
         court_id = data.get('court_id')
         date_str = data.get('date')
 
@@ -639,7 +648,7 @@ def create_booking(request):
 
         try:
             slot_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-        except ValueError:
+        except (TypeError, ValueError):
             return JsonResponse({
                 'success': False,
                 'message': 'Format tanggal tidak valid'
@@ -648,7 +657,7 @@ def create_booking(request):
         # Check if court exists
         try:
             court = Court.objects.get(id=court_id)
-        except Court.DoesNotExist:
+        except (Court.DoesNotExist, TypeError, ValueError):
             return JsonResponse({
                 'success': False,
                 'message': 'Court not found'
@@ -689,11 +698,6 @@ def create_booking(request):
             'success': False,
             'message': 'Invalid JSON'
         }, status=400)
-    except Exception as e:
-        return JsonResponse({
-            'success': False,
-            'message': str(e)
-        }, status=500)
 
 @csrf_exempt
 @require_http_methods(["GET"])
@@ -817,7 +821,7 @@ def api_court_whatsapp(request):
     try:
         court = Court.objects.get(id=court_id)
     except Court.DoesNotExist:
-        return JsonResponse({'success': False, 'error': 'Court not found'}, status=404)
+        return JsonResponse(_COURT_NOT_FOUND, status=404)
 
     whatsapp_link = court.get_whatsapp_link(
         date=data.get('date'),
@@ -838,19 +842,19 @@ def get_whatsapp_link(request):
             return error_response
         try:
             data = json.loads(request.body)
-            court_id = data.get('court_id')
-            date = data.get('date')
-            time = data.get('time')
+        except json.JSONDecodeError:
+            return JsonResponse({'success': False, 'error': 'Invalid JSON'}, status=400)
+        if not isinstance(data, dict):
+            return JsonResponse({'success': False, 'error': 'Invalid JSON'}, status=400)
 
+        try:
             # Ambil data court dari database
-            court = Court.objects.get(id=court_id)
+            court = Court.objects.get(id=data.get('court_id'))
+        except (Court.DoesNotExist, TypeError, ValueError):
+            return JsonResponse(_COURT_NOT_FOUND, status=404)
 
-            whatsapp_link = court.get_whatsapp_link(date=date, time=time)
+        whatsapp_link = court.get_whatsapp_link(date=data.get('date'), time=data.get('time'))
 
-            return JsonResponse({'success': True, 'whatsapp_link': whatsapp_link})
-        except Court.DoesNotExist:
-            return JsonResponse({'success': False, 'error': 'Court not found'}, status=404)
-        except Exception as e:
-            return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return JsonResponse({'success': True, 'whatsapp_link': whatsapp_link})
     else:
-        return JsonResponse({'success': False, 'error': 'Invalid request method'}, status=405)
+        return JsonResponse(_INVALID_METHOD, status=405)
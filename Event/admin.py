@@ -1,11 +1,45 @@
 from django.contrib import admin
+from django.contrib.admin.utils import lookup_spawns_duplicates
+from django.db.models import Q
+
 from .models import Event, EventSchedule, EventRegistration
 
+# Search terms shorter than this only match the start of the event name.
+CONTAINS_SEARCH_MIN_LENGTH = 4
+
+
+class PrefixSearchMixin:
+    """Search short terms by prefix, longer ones with the normal admin search.
+
+    One to three characters are matched with istartswith against
+    ``prefix_search_fields``, which PostgreSQL serves from the
+    UPPER(name) index (Event migration 0002). Longer terms go through the
+    normal ``search_fields`` lookup (icontains), so "Basketball" still
+    finds "Jakarta Basketball Cup".
+    """
+    prefix_search_fields = ()
+
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not term or len(term) >= CONTAINS_SEARCH_MIN_LENGTH or not self.prefix_search_fields:
+            return super().get_search_results(request, queryset, search_term)
+
+        query = Q()
+        for field in self.prefix_search_fields:
+            query |= Q(**{f'{field}__istartswith': term})
+        may_have_duplicates = any(
+            lookup_spawns_duplicates(self.opts, field) for field in self.prefix_search_fields
+        )
+        return queryset.filter(query), may_have_duplicates
+
+
 @admin.register(Event)
-class EventAdmin(admin.ModelAdmin):
+class EventAdmin(PrefixSearchMixin, admin.ModelAdmin):
     list_display = ('name', 'sport_type', 'city', 'entry_price', 'status', 'organizer', 'created_at')
     list_filter = ('sport_type', 'status', 'created_at')
-    search_fields = ('name', 'city', 'description', 'organizer__username')
+    list_select_related = ('organizer',)
+    search_fields = ('name', 'city', 'description', 'organizer__email')
+    prefix_search_fields = ('name',)
     readonly_fields = ('created_at', 'updated_at')
     
     fieldsets = (
@@ -29,31 +63,26 @@ class EventAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
     )
-    
-    def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        return qs.select_related('organizer')
 
 
 @admin.register(EventSchedule)
-class EventScheduleAdmin(admin.ModelAdmin):
+class EventScheduleAdmin(PrefixSearchMixin, admin.ModelAdmin):
     list_display = ('event', 'date', 'is_available')
     list_filter = ('is_available', 'date')
+    list_select_related = ('event',)
     search_fields = ('event__name',)
+    prefix_search_fields = ('event__name',)
     date_hierarchy = 'date'
-    
-    def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        return qs.select_related('event')
 
 
 @admin.register(EventRegistration)
-class EventRegistrationAdmin(admin.ModelAdmin):
+class EventRegistrationAdmin(PrefixSearchMixin, admin.ModelAdmin):
     list_display = ('user', 'event', 'schedule', 'registered_at')
     list_filter = ('registered_at',)
-    search_fields = ('user__username', 'event__name')
-    date_hierarchy = 'registered_at'
-    
-    def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        return qs.select_related('user', 'event', 'schedule')
\ No newline at end of file
+    list_select_related = ('user', 'event', 'schedule__event')
+    # Plain <select>s would render str() of every user/event/schedule, and
+    # EventSchedule.__str__ loads its event, i.e. one query per option.
+    raw_id_fields = ('user', 'event', 'schedule')
+    search_fields = ('user__email', 'event__name')
+    prefix_search_fields = ('event__name',)
+    date_hierarchy = 'registered_at'
\ No newline at end of file
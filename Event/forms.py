@@ -9,14 +9,36 @@ CITY_CHOICES = [
 ]
 
 _CITY_CANONICAL = {c.casefold(): c for c in CITY_CHOICES}
+_CITY_SET = frozenset(CITY_CHOICES)
+# Stored choice value keyed by both the casefolded value and label, so
+# "Tennis", "tennis" and "Table Tennis" all resolve to the stored code.
+_SPORT_CANONICAL = {
+    key.casefold(): value
+    for value, label in Event.SportType.choices
+    for key in (value, label)
+}
+_STATUS_CANONICAL = {
+    key.casefold(): value
+    for value, label in Event.Status.choices
+    for key in (value, label)
+}
 
-def canonical_city(value):
+def _canonical(mapping, value):
     if value is None:
         return None
     cleaned = " ".join(str(value).split()).strip()
     if not cleaned:
         return None
-    return _CITY_CANONICAL.get(cleaned.casefold())
+    return mapping.get(cleaned.casefold())
+
+def canonical_city(value):
+    return _canonical(_CITY_CANONICAL, value)
+
+def canonical_sport_type(value):
+    return _canonical(_SPORT_CANONICAL, value)
+
+def canonical_status(value):
+    return _canonical(_STATUS_CANONICAL, value)
 
 class EventForm(forms.ModelForm):
     city = forms.ChoiceField(
@@ -110,6 +132,9 @@ class EventForm(forms.ModelForm):
 
     def clean_city(self):
         value = self.cleaned_data.get('city')
+        # ChoiceField already validated membership; skip normalisation
+        if value in _CITY_SET:
+            return value
         city = canonical_city(value)
         if not city:
             raise ValidationError('Please select a valid city.')
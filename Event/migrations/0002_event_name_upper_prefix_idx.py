@@ -0,0 +1,35 @@
+from django.db import migrations
+
+# Short admin searches match the event name by prefix (istartswith), which
+# PostgreSQL receives as UPPER("name"::text) LIKE UPPER('foo%'). A
+# pattern-ops index on the bare column cannot serve that; an index on
+# UPPER(name) with text_pattern_ops can. Opclass expression indexes are
+# PostgreSQL-only, so other backends (SQLite in development) skip it.
+INDEX_NAME = 'event_name_upper_prefix_idx'
+
+
+def create_prefix_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = schema_editor.quote_name(apps.get_model('Event', 'Event')._meta.db_table)
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(INDEX_NAME)} '
+        f'ON {table} (UPPER({schema_editor.quote_name("name")}) text_pattern_ops)'
+    )
+
+
+def drop_prefix_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(f'DROP INDEX IF EXISTS {schema_editor.quote_name(INDEX_NAME)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Event', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_index, drop_prefix_index),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Auth_Profile', '0001_initial'),
+        ('Event', '0002_event_name_upper_prefix_idx'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='eventregistration',
+            constraint=models.UniqueConstraint(fields=('event', 'user', 'schedule'), name='uniq_event_user_schedule'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='eventregistration',
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name='eventregistration',
+            index=models.Index(fields=['user', 'event'], name='event_reg_user_event_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Auth_Profile', '0001_initial'),
+        ('Event', '0003_alter_eventregistration_unique_together_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['-created_at'], name='event_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventschedule',
+            index=models.Index(fields=['event', 'is_available', 'date'], name='event_sched_upcoming_idx'),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:59
+
+from django.db import migrations, models
+
+# Frozen copy of Event.SportType at this migration.
+SPORT_CHOICES = [
+    ('tennis', 'Tennis'),
+    ('basketball', 'Basketball'),
+    ('soccer', 'Soccer'),
+    ('badminton', 'Badminton'),
+    ('volleyball', 'Volleyball'),
+    ('paddle', 'Paddle'),
+    ('futsal', 'Futsal'),
+    ('table_tennis', 'Table Tennis'),
+    ('swimming', 'Swimming'),
+]
+MAX_LENGTH = 20
+
+
+def normalise_sport_type(apps, schema_editor):
+    """Store sport_type as the choice code before the column shrinks.
+
+    The JSON endpoints used to save whatever the client sent, so rows may
+    hold a label or mixed case ("Table Tennis"). Those are mapped to the
+    code. Anything else longer than the new column would make the ALTER
+    fail, so it is reported here instead, with the ids to fix.
+    """
+    Event = apps.get_model('Event', 'Event')
+    canonical = {
+        key.casefold(): value
+        for value, label in SPORT_CHOICES
+        for key in (value, label)
+    }
+    codes = {value for value, _ in SPORT_CHOICES}
+    stored = Event.objects.exclude(sport_type__in=codes).values_list('sport_type', flat=True).distinct()
+    too_long = []
+    for old in stored:
+        new = canonical.get(' '.join(old.split()).casefold())
+        if new:
+            Event.objects.filter(sport_type=old).update(sport_type=new)
+        elif len(old) > MAX_LENGTH:
+            too_long.extend(Event.objects.filter(sport_type=old).values_list('pk', flat=True))
+    if too_long:
+        raise ValueError(
+            f'Event sport_type longer than {MAX_LENGTH} characters and not a known sport '
+            f'for event ids {sorted(too_long)}; fix these rows and re-run the migration.'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Event', '0004_event_event_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalise_sport_type, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='event',
+            name='sport_type',
+            field=models.CharField(choices=[('tennis', 'Tennis'), ('basketball', 'Basketball'), ('soccer', 'Soccer'), ('badminton', 'Badminton'), ('volleyball', 'Volleyball'), ('paddle', 'Paddle'), ('futsal', 'Futsal'), ('table_tennis', 'Table Tennis'), ('swimming', 'Swimming')], max_length=20),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Auth_Profile', '0001_initial'),
+        ('Event', '0005_alter_event_sport_type'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['sport_type', 'status', '-created_at'], name='event_sport_status_idx'),
+        ),
+    ]
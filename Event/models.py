@@ -1,31 +1,83 @@
-from django.db import models
-from Auth_Profile.models import User
-from Auth_Profile.models import User
+from django.db import models, transaction
+from django.db.models import BooleanField, Case, Value, When
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.core.files.base import ContentFile
+from django.utils.functional import cached_property
+from PIL import Image, ImageOps, UnidentifiedImageError
+import hashlib
+import io
 import uuid
 
+PHOTO_MAX_SIZE = (1600, 1600)
+
+SPORT_EMOJI = {
+    'tennis': '🎾',
+    'basketball': '🏀',
+    'soccer': '⚽',
+    'badminton': '🏸',
+    'volleyball': '🏐',
+    'futsal': '⚽',
+    'paddle': '🏓',
+    'table_tennis': '🏓',
+    'swimming': '🏊',
+}
+DEFAULT_SPORT_EMOJI = '🏃'
+
+
+def _encode_photo_webp(upload):
+    """Re-encode an uploaded photo as WebP under a content-hashed name.
+
+    Returns None when the file is not a readable image so the original
+    upload is stored untouched.
+    """
+    try:
+        img = Image.open(upload)
+        # WebP output carries no EXIF, so apply the camera's orientation first
+        img = ImageOps.exif_transpose(img)
+        img.thumbnail(PHOTO_MAX_SIZE)
+    except (UnidentifiedImageError, OSError):
+        return None
+    if img.mode not in ('RGB', 'RGBA'):
+        img = img.convert('RGBA' if 'A' in img.getbands() or img.mode == 'P' else 'RGB')
+    buf = io.BytesIO()
+    img.save(buf, format='WEBP', quality=82, method=6)
+    data = buf.getvalue()
+    return ContentFile(data, name=f"{hashlib.blake2b(data).hexdigest()[:16]}.webp")
+
+
+class EventQuerySet(models.QuerySet):
+    def for_listing(self):
+        """Events for list pages/endpoints, with the organizer joined in."""
+        return self.select_related('organizer')
+
+    def card_fields(self):
+        """Skip the long text columns that event cards never display."""
+        return self.defer('description', 'activities', 'google_maps_link')
+
+
 class Event(models.Model):
     """Model untuk event olahraga"""
-    SPORT_CHOICES = [
-        ('tennis', 'Tennis'),
-        ('basketball', 'Basketball'),
-        ('soccer', 'Soccer'),
-        ('badminton', 'Badminton'),
-        ('volleyball', 'Volleyball'),
-        ('paddle', 'Paddle'),
-        ('futsal', 'Futsal'),
-        ('table_tennis', 'Table Tennis'),
-        ('swimming', 'Swimming'),
-    ]
-    
-    STATUS_CHOICES = [
-        ('available', 'Available'),
-        ('unavailable', 'Unavailable'),
-    ]
+    class SportType(models.TextChoices):
+        TENNIS = 'tennis', 'Tennis'
+        BASKETBALL = 'basketball', 'Basketball'
+        SOCCER = 'soccer', 'Soccer'
+        BADMINTON = 'badminton', 'Badminton'
+        VOLLEYBALL = 'volleyball', 'Volleyball'
+        PADDLE = 'paddle', 'Paddle'
+        FUTSAL = 'futsal', 'Futsal'
+        TABLE_TENNIS = 'table_tennis', 'Table Tennis'
+        SWIMMING = 'swimming', 'Swimming'
+
+    class Status(models.TextChoices):
+        AVAILABLE = 'available', 'Available'
+        UNAVAILABLE = 'unavailable', 'Unavailable'
+
+    SPORT_CHOICES = SportType.choices
+    STATUS_CHOICES = Status.choices
     
     # Basic Info
     name = models.CharField(max_length=200)
-    sport_type = models.CharField(max_length=50, choices=SPORT_CHOICES)
+    sport_type = models.CharField(max_length=20, choices=SportType.choices)
     description = models.TextField(blank=True, null=True)
     
     
@@ -49,25 +101,73 @@ class Event(models.Model):
     photo = models.ImageField(upload_to='events/', blank=True, null=True)
     
     # Status & Metadata
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='available')
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.AVAILABLE)
     organizer = models.ForeignKey('Auth_Profile.User', on_delete=models.CASCADE, related_name='organized_events')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     # Categories
     category = models.CharField(max_length=100, default='category 1', blank=True)
+
+    objects = EventQuerySet.as_manager()
     
     class Meta:
         ordering = ['-created_at']
+        # The admin's short-term name search compiles to UPPER(name) LIKE
+        # 'FOO%' on PostgreSQL; its expression index is created in migration
+        # 0002 because SQLite cannot build an opclass index.
+        indexes = [
+            # Default ordering of every list view
+            models.Index(fields=['-created_at'], name='event_created_idx'),
+            # Sport / availability filters of the list views, already in list order
+            models.Index(fields=['sport_type', 'status', '-created_at'], name='event_sport_status_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.sport_type}"
+
+    def save(self, *args, **kwargs):
+        # Only freshly uploaded files are re-encoded; stored photos are left alone
+        if self.photo and not self.photo._committed:
+            encoded = _encode_photo_webp(self.photo.file)
+            if encoded is not None:
+                self.photo = encoded
+        super().save(*args, **kwargs)
     
-    def get_activities_list(self):
-        """Return activities as list"""
+    @cached_property
+    def activities_list(self):
+        """Activities split once per instance"""
         if self.activities:
             return [activity.strip() for activity in self.activities.split(',')]
         return []
+
+    @classmethod
+    def registration_counts(cls, event_ids):
+        """Map event id -> registration count in one GROUP BY query.
+
+        Events without registrations are missing from the result.
+        """
+        rows = (
+            EventRegistration.objects.filter(event_id__in=event_ids)
+            .values('event_id')
+            .annotate(total=models.Count('pk'))
+            .values_list('event_id', 'total')
+        )
+        return dict(rows)
+
+    def get_activities_list(self):
+        """Return activities as list"""
+        return self.activities_list
+
+    @property
+    def sport_emoji(self):
+        """Emoji for the sport type, looked up from the model constant"""
+        return SPORT_EMOJI.get(self.sport_type, DEFAULT_SPORT_EMOJI)
+
+    @cached_property
+    def photo_url(self):
+        """Storage URL of the photo, resolved once per instance ('' if none)"""
+        return self.photo.url if self.photo else ''
     
     def get_status_display_badge(self):
         """Return status with badge class"""
@@ -93,16 +193,54 @@ class Event(models.Model):
         return self.full_address
 
 
+class EventScheduleQuerySet(models.QuerySet):
+    def set_availability(self, flags):
+        """Update is_available for many schedules in one UPDATE.
+
+        ``flags`` maps schedule pk -> bool. Returns the number of rows updated.
+        """
+        if not flags:
+            return 0
+        whens = [When(pk=pk, then=Value(flag)) for pk, flag in flags.items()]
+        return self.filter(pk__in=flags).update(
+            is_available=Case(*whens, output_field=BooleanField())
+        )
+
+    def add_dates(self, event, dates):
+        """Create available schedules for ``dates`` in one INSERT.
+
+        Dates the event already has are skipped by the unique constraint.
+        """
+        rows = [self.model(event=event, date=d, is_available=True) for d in dates]
+        return self.bulk_create(rows, ignore_conflicts=True, batch_size=500)
+
+    def sync_dates(self, event, dates):
+        """Make ``event``'s schedules exactly ``dates`` (one DELETE, one INSERT).
+
+        Schedules on other dates are removed along with their registrations;
+        schedules kept keep their availability.
+        """
+        with transaction.atomic(using=self.db):
+            self.filter(event=event).exclude(date__in=dates).delete()
+            self.add_dates(event, dates)
+
+
 class EventSchedule(models.Model):
     """Store available dates for events"""
     pk_event_sched = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='schedules')
     date = models.DateField()
     is_available = models.BooleanField(default=True)
+
+    objects = EventScheduleQuerySet.as_manager()
     
     class Meta:
         ordering = ['date']
         unique_together = ['event', 'date']
+        indexes = [
+            # Upcoming available dates of an event (detail page, schedule APIs)
+            models.Index(fields=['event', 'is_available', 'date'], name='event_sched_upcoming_idx'),
+        ]
     
     def __str__(self):
         return f"{self.event.name} - {self.date}"
@@ -118,7 +256,23 @@ class EventRegistration(models.Model):
     
     class Meta:
         ordering = ['-registered_at']
-        unique_together = ['event', 'user', 'schedule']
+        constraints = [
+            models.UniqueConstraint(fields=['event', 'user', 'schedule'], name='uniq_event_user_schedule'),
+        ]
+        indexes = [
+            # Covers "events this user joined" lookups (values_list('event_id'))
+            models.Index(fields=['user', 'event'], name='event_reg_user_event_idx'),
+        ]
     
     def __str__(self):
-        return f"{self.user.username} - {self.event.name} ({self.schedule.date})"
\ No newline at end of file
+        return f"{self.user.email} - {self.event.name} ({self.schedule.date})"
+
+    @classmethod
+    def bulk_register(cls, event, schedule, users):
+        """Register several users for one schedule in a single INSERT.
+
+        Users already registered for the schedule are skipped by the
+        unique constraint instead of raising.
+        """
+        rows = [cls(event=event, schedule=schedule, user=user) for user in users]
+        return cls.objects.bulk_create(rows, ignore_conflicts=True, batch_size=500)
@@ -1,29 +1,22 @@
+from decimal import Decimal, InvalidOperation
+
 from django import template
 
+from Event.models import DEFAULT_SPORT_EMOJI, SPORT_EMOJI
+
 register = template.Library()
 
-@register.filter
+@register.filter(is_safe=True)
 def get_sport_emoji(sport_type):
     """Return emoji for sport type"""
-    emoji_map = {
-        'tennis': '🎾',
-        'basketball': '🏀',
-        'soccer': '⚽',
-        'badminton': '🏸',
-        'volleyball': '🏐',
-        'futsal': '⚽',
-        'paddle': '🏓',
-        'table_tennis': '🏓',
-        'swimming': '🏊',
-    }
-    return emoji_map.get(sport_type, '🏃')
+    return SPORT_EMOJI.get(sport_type, DEFAULT_SPORT_EMOJI)
 
 @register.filter
 def rupiah(value):
     """Format number with dot thousand separators (e.g. 2000 -> 2.000)."""
+    # Decimal keeps large prices exact (no float round-trip) and the sign intact
     try:
-        amount = float(value)
-    except (TypeError, ValueError):
+        amount = value if isinstance(value, Decimal) else Decimal(str(value))
+    except (TypeError, ValueError, InvalidOperation):
         return value
-    formatted = f"{amount:,.0f}".replace(",", ".")
-    return formatted
+    return f"{amount:,.0f}".replace(",", ".")
@@ -1,29 +1,106 @@
-from django.test import TestCase, Client
-from django.urls import reverse
+from django.conf import settings
+from django.contrib.admin.sites import site as admin_site
+from django.test import RequestFactory, SimpleTestCase, TestCase, Client, override_settings
+from django.urls import resolve, reverse
 from Auth_Profile.models import User
 from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
 from django.core.files.uploadedfile import SimpleUploadedFile
+from importlib import import_module
 from decimal import Decimal
-from datetime import datetime, timedelta, date
+from datetime import timedelta, date
+from io import BytesIO
 import json
+import shutil
+import tempfile
+from PIL import Image
+from Event import views
 from Event.models import Event, EventSchedule, EventRegistration
 from Event.forms import EventForm, EventScheduleForm
+from Event.templatetags.event_extras import get_sport_emoji, rupiah
+
+
+# Hashed once at import; every test user shares the same password
+TEST_PASSWORD_HASH = make_password('testpass123')
+
+# A valid EventForm submission; tests override only the fields they check
+EVENT_FORM_DATA = {
+    'name': 'New Event',
+    'sport_type': 'tennis',
+    'city': 'Jakarta',
+    'full_address': 'Jl. Test',
+    'entry_price': '100000',
+    'activities': 'Court',
+    'rating': '4.5',
+    'category': 'Competition',
+    'status': 'available',
+}
+
+
+def create_test_image(name='photo.png', size=(10, 10)):
+    """Create a small valid PNG upload"""
+    bio = BytesIO()
+    Image.new('RGB', size).save(bio, format='PNG')
+    return SimpleUploadedFile(name, bio.getvalue(), content_type='image/png')
+
+
+def create_user_session(user):
+    """Store a session logged in as `user` and return its key"""
+    session = import_module(settings.SESSION_ENGINE).SessionStore()
+    session['user_id'] = str(user.id)
+    session.create()
+    return session.session_key
+
+
+def login_as(client, user):
+    """Switch the client's session to `user` (custom_login_required reads user_id)"""
+    session = client.session
+    session['user_id'] = str(user.id)
+    session.save()
+
+
+def create_test_user(nama='testuser', email='test@test.com', **fields):
+    """Create a User, filling the fields tests don't care about"""
+    fields.setdefault('kelamin', 'L')
+    fields.setdefault('tanggal_lahir', '2000-01-01')
+    fields.setdefault('nomor_handphone', '08123456789')
+    fields.setdefault('password', TEST_PASSWORD_HASH)
+    return User.objects.create(nama=nama, email=email, **fields)
+
+
+class BaseEventTestCase(TestCase):
+    """Shared fixture: one organizer and one tennis event they organize"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_test_user()
+        cls.event = Event.objects.create(
+            name='Test Event',
+            sport_type='tennis',
+            city='Jakarta',
+            full_address='Jl. Test',
+            entry_price=Decimal('100000'),
+            activities='Court',
+            organizer=cls.user
+        )
+
+    def post_json(self, url, payload):
+        """POST `payload` serialised as a JSON request body.
+
+        Read the reply with ``response.json()``, which parses the body once
+        and caches it on the response.
+        """
+        return self.client.post(url, payload, content_type='application/json')
 
 
 class EventModelTest(TestCase):
     """Test Event model"""
     
-    def setUp(self):
-        self.user = User.objects.create(
-            nama='testuser',
-            email='test@test.com',
-            kelamin='L',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456789',
-            password=make_password('testpass123')
-        )
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_test_user()
         
-        self.event = Event.objects.create(
+        cls.event = Event.objects.create(
             name='Test Tennis Event',
             sport_type='tennis',
             description='A test tennis event',
@@ -34,7 +111,7 @@ class EventModelTest(TestCase):
             rating=Decimal('4.50'),
             category='Competition',
             status='available',
-            organizer=self.user
+            organizer=cls.user
         )
     
     def test_event_creation(self):
@@ -44,6 +121,78 @@ class EventModelTest(TestCase):
         self.assertEqual(self.event.organizer, self.user)
         self.assertEqual(self.event.status, 'available')
     
+    def test_event_ordering(self):
+        """Test events are ordered by created_at descending"""
+        event2 = Event.objects.create(
+            name='Newer Event',
+            sport_type='basketball',
+            city='Surabaya',
+            full_address='Jl. Test 2',
+            entry_price=Decimal('75000'),
+            activities='Court',
+            organizer=self.user
+        )
+        self.assertQuerySetEqual(Event.objects.all(), [event2, self.event])
+    
+    def test_for_listing_joins_organizer(self):
+        """Test for_listing loads organizers in the same query"""
+        with self.assertNumQueries(1):
+            organizers = [event.organizer.email for event in Event.objects.for_listing()]
+        self.assertEqual(organizers, [self.user.email])
+    
+    def test_card_fields_defers_text_columns(self):
+        """Test card_fields leaves long text columns out of the query"""
+        event = Event.objects.card_fields().get(pk=self.event.pk)
+        self.assertEqual(
+            event.get_deferred_fields(),
+            {'description', 'activities', 'google_maps_link'},
+        )
+    
+    def test_photo_saved_as_webp(self):
+        """Test uploaded photos are re-encoded to WebP with a hashed name"""
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        with override_settings(MEDIA_ROOT=media_root):
+            self.event.photo = create_test_image(size=(2000, 1000))
+            self.event.save()
+            self.assertRegex(self.event.photo.name, r'^events/[0-9a-f]{16}\.webp$')
+            with Image.open(self.event.photo.path) as img:
+                self.assertEqual(img.format, 'WEBP')
+                self.assertEqual(img.size, (1600, 800))
+
+    def test_photo_exif_orientation_applied(self):
+        """Test a phone photo tagged 'rotate 90' is stored upright"""
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Orientation: rotate 90 CW to display
+        bio = BytesIO()
+        Image.new('RGB', (400, 200)).save(bio, format='JPEG', exif=exif)
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        with override_settings(MEDIA_ROOT=media_root):
+            self.event.photo = SimpleUploadedFile('phone.jpg', bio.getvalue(), content_type='image/jpeg')
+            self.event.save()
+            with Image.open(self.event.photo.path) as img:
+                self.assertEqual(img.size, (200, 400))
+                self.assertNotIn(0x0112, img.getexif())
+
+
+class EventInMemoryTest(SimpleTestCase):
+    """Test Event attributes on an unsaved instance (no queries)"""
+    
+    def setUp(self):
+        self.event = Event(
+            name='Test Tennis Event',
+            sport_type='tennis',
+            description='A test tennis event',
+            city='Jakarta',
+            full_address='Jl. Test No. 1, Jakarta',
+            entry_price=Decimal('100000.00'),
+            activities='Court, Shower, Locker',
+            rating=Decimal('4.50'),
+            category='Competition',
+            status='available',
+        )
+    
     def test_event_str_method(self):
         """Test __str__ method"""
         expected = 'Test Tennis Event - tennis'
@@ -58,53 +207,25 @@ class EventModelTest(TestCase):
     
     def test_get_activities_list_empty(self):
         """Test get_activities_list with empty activities"""
-        event = Event.objects.create(
-            name='Event No Activities',
-            sport_type='soccer',
-            city='Bandung',
-            full_address='Jl. Test',
-            entry_price=Decimal('50000'),
-            activities='',
-            organizer=self.user
-        )
-        result = event.get_activities_list()
-        self.assertTrue(isinstance(result, list))
+        self.event.activities = ''
+        self.assertEqual(self.event.get_activities_list(), [])
     
-    def test_event_ordering(self):
-        """Test events are ordered by created_at descending"""
-        event2 = Event.objects.create(
-            name='Newer Event',
-            sport_type='basketball',
-            city='Surabaya',
-            full_address='Jl. Test 2',
-            entry_price=Decimal('75000'),
-            activities='Court',
-            organizer=self.user
-        )
-        events = Event.objects.all()
-        self.assertEqual(events[0], event2)
-        self.assertEqual(events[1], self.event)
+    def test_activities_list_cached(self):
+        """Test activities_list is split once per instance"""
+        self.assertEqual(self.event.activities_list, ['Court', 'Shower', 'Locker'])
+        self.assertIs(self.event.get_activities_list(), self.event.activities_list)
     
     def test_event_rating_validation(self):
         """Test rating validators"""
-        event = Event(
-            name='Test',
-            sport_type='tennis',
-            city='Jakarta',
-            full_address='Test',
-            entry_price=Decimal('100000'),
-            activities='Test',
-            rating=Decimal('5.00'),
-            organizer=self.user
-        )
-        event.full_clean()
-        self.assertTrue(True)
+        rating = Event._meta.get_field('rating')
+        rating.run_validators(Decimal('5.00'))
+        with self.assertRaises(ValidationError):
+            rating.run_validators(Decimal('5.01'))
     
     def test_is_available_property(self):
         """Test is_available property"""
         self.assertTrue(self.event.is_available)
         self.event.status = 'unavailable'
-        self.event.save()
         self.assertFalse(self.event.is_available)
     
     def test_title_property(self):
@@ -114,33 +235,27 @@ class EventModelTest(TestCase):
     def test_location_property(self):
         """Test location property"""
         self.assertEqual(self.event.location, self.event.full_address)
+    
+    def test_sport_emoji(self):
+        """Test sport_emoji follows sport_type"""
+        self.assertEqual(self.event.sport_emoji, '🎾')
+        self.event.sport_type = 'swimming'
+        self.assertEqual(self.event.sport_emoji, '🏊')
+    
+    def test_photo_url_without_photo(self):
+        """Test photo_url is empty when no photo is set"""
+        self.assertEqual(self.event.photo_url, '')
 
 
-class EventScheduleModelTest(TestCase):
+class EventScheduleModelTest(BaseEventTestCase):
     """Test EventSchedule model"""
     
-    def setUp(self):
-        self.user = User.objects.create(
-            nama='testuser',
-            email='test@test.com',
-            kelamin='L',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456789',
-            password=make_password('testpass123')
-        )
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         
-        self.event = Event.objects.create(
-            name='Test Event',
-            sport_type='tennis',
-            city='Jakarta',
-            full_address='Jl. Test',
-            entry_price=Decimal('100000'),
-            activities='Court',
-            organizer=self.user
-        )
-        
-        self.schedule = EventSchedule.objects.create(
-            event=self.event,
+        cls.schedule = EventSchedule.objects.create(
+            event=cls.event,
             date=date.today() + timedelta(days=7),
             is_available=True
         )
@@ -172,44 +287,58 @@ class EventScheduleModelTest(TestCase):
             date=date.today() + timedelta(days=14),
             is_available=True
         )
-        schedules = EventSchedule.objects.all()
-        self.assertEqual(schedules[0], self.schedule)
-        self.assertEqual(schedules[1], schedule2)
+        self.assertQuerySetEqual(EventSchedule.objects.all(), [self.schedule, schedule2])
+
+    def test_set_availability_bulk(self):
+        """Test set_availability updates many schedules in one query"""
+        schedule2 = EventSchedule.objects.create(
+            event=self.event,
+            date=date.today() + timedelta(days=14),
+            is_available=False
+        )
+        with self.assertNumQueries(1):
+            updated = EventSchedule.objects.set_availability({
+                self.schedule.pk: False,
+                schedule2.pk: True,
+            })
+        self.assertEqual(updated, 2)
+        self.schedule.refresh_from_db()
+        schedule2.refresh_from_db()
+        self.assertFalse(self.schedule.is_available)
+        self.assertTrue(schedule2.is_available)
+
+    def test_sync_dates(self):
+        """Test sync_dates drops other dates, adds new ones and keeps existing rows"""
+        kept = EventSchedule.objects.create(
+            event=self.event,
+            date=date.today() + timedelta(days=14),
+            is_available=False
+        )
+        added = date.today() + timedelta(days=21)
+        EventSchedule.objects.sync_dates(self.event, {kept.date, added})
+        self.assertQuerySetEqual(
+            EventSchedule.objects.filter(event=self.event).values_list('date', 'is_available'),
+            [(kept.date, False), (added, True)]
+        )
 
 
-class EventRegistrationModelTest(TestCase):
+class EventRegistrationModelTest(BaseEventTestCase):
     """Test EventRegistration model"""
     
-    def setUp(self):
-        self.user = User.objects.create(
-            nama='testuser',
-            email='test@test.com',
-            kelamin='L',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456789',
-            password=make_password('testpass123')
-        )
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         
-        self.event = Event.objects.create(
-            name='Test Event',
-            sport_type='tennis',
-            city='Jakarta',
-            full_address='Jl. Test',
-            entry_price=Decimal('100000'),
-            activities='Court',
-            organizer=self.user
-        )
-        
-        self.schedule = EventSchedule.objects.create(
-            event=self.event,
+        cls.schedule = EventSchedule.objects.create(
+            event=cls.event,
             date=date.today() + timedelta(days=7),
             is_available=True
         )
         
-        self.registration = EventRegistration.objects.create(
-            event=self.event,
-            user=self.user,
-            schedule=self.schedule
+        cls.registration = EventRegistration.objects.create(
+            event=cls.event,
+            user=cls.user,
+            schedule=cls.schedule
         )
     
     def test_registration_creation(self):
@@ -217,6 +346,23 @@ class EventRegistrationModelTest(TestCase):
         self.assertEqual(self.registration.event, self.event)
         self.assertEqual(self.registration.user, self.user)
         self.assertEqual(self.registration.schedule, self.schedule)
+
+    def test_registration_str_method(self):
+        """Test __str__ method"""
+        expected = f"{self.user.email} - {self.event.name} ({self.schedule.date})"
+        self.assertEqual(str(self.registration), expected)
+
+    def test_bulk_register_skips_existing(self):
+        """Test bulk_register inserts new users and ignores duplicates"""
+        other = create_test_user(nama='otheruser', email='other@test.com')
+        EventRegistration.bulk_register(self.event, self.schedule, [self.user, other])
+        self.assertEqual(self.schedule.registrations.count(), 2)
+
+    def test_registration_counts(self):
+        """Test registration_counts groups by event in one query"""
+        with self.assertNumQueries(1):
+            counts = Event.registration_counts([self.event.pk])
+        self.assertEqual(counts, {self.event.pk: 1})
     
     
     def test_registration_unique_together(self):
@@ -230,43 +376,22 @@ class EventRegistrationModelTest(TestCase):
             )
 
 
-class EventFormTest(TestCase):
+class EventFormTest(SimpleTestCase):
     """Test EventForm"""
     
-    def setUp(self):
-        self.user = User.objects.create(
-            nama='testuser',
-            email='test@test.com',
-            kelamin='L',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456789',
-            password=make_password('testpass123')
-        )
-    
-    def test_valid_form(self):
-        """Test form with valid data"""
-        form_data = {
-            'name': 'Test Event',
-            'sport_type': 'tennis',
-            'city': 'Jakarta',
-            'full_address': 'Jl. Test No. 1',
-            'entry_price': '100000.00',
-            'activities': 'Court, Shower',
-            'rating': '4.5',
-            'description': 'Test description',
-            'category': 'Competition',
-            'status': 'available'
-        }
-        form = EventForm(data=form_data)
-        self.assertTrue(form.is_valid())
-    
-    def test_invalid_form_missing_required(self):
-        """Test form with missing required fields"""
-        form_data = {
-            'name': 'Test Event',
-        }
-        form = EventForm(data=form_data)
-        self.assertFalse(form.is_valid())
+    def test_form_validation(self):
+        """Test valid data, missing required fields and an unknown sport type"""
+        cases = [
+            ({**EVENT_FORM_DATA, 'description': 'Test description'}, None),
+            ({'name': 'Test Event'}, 'sport_type'),
+            ({**EVENT_FORM_DATA, 'sport_type': 'curling'}, 'sport_type'),
+        ]
+        for form_data, error_field in cases:
+            with self.subTest(error_field=error_field, sport_type=form_data.get('sport_type')):
+                form = EventForm(data=form_data)
+                self.assertEqual(form.is_valid(), error_field is None)
+                if error_field:
+                    self.assertIn(error_field, form.errors)
     
     def test_form_field_widgets(self):
         """Test form widgets are configured"""
@@ -275,7 +400,7 @@ class EventFormTest(TestCase):
         self.assertIn('form-select', form.fields['sport_type'].widget.attrs['class'])
 
 
-class EventScheduleFormTest(TestCase):
+class EventScheduleFormTest(SimpleTestCase):
     """Test EventScheduleForm"""
     
     def test_valid_form(self):
@@ -293,221 +418,230 @@ class EventScheduleFormTest(TestCase):
         self.assertTrue(hasattr(form.fields['date'].widget, 'attrs'))
 
 
+class EventExtrasTest(SimpleTestCase):
+    """Test event_extras template filters"""
+
+    def test_get_sport_emoji(self):
+        """Test known and unknown sport types"""
+        self.assertEqual(get_sport_emoji('tennis'), '🎾')
+        self.assertEqual(get_sport_emoji('unknown'), '🏃')
+
+    def test_rupiah(self):
+        """Test thousand separators without float rounding"""
+        self.assertEqual(rupiah(Decimal('100000.00')), '100.000')
+        self.assertEqual(rupiah(-2500), '-2.500')
+        self.assertEqual(rupiah('12345678901234567'), '12.345.678.901.234.567')
+        self.assertEqual(rupiah('abc'), 'abc')
+        self.assertIsNone(rupiah(None))
+
+
+class EventAdminSearchTest(BaseEventTestCase):
+    """Test the admin's prefix/contains search split"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.cup = Event.objects.create(
+            name='Jakarta Basketball Cup',
+            sport_type='basketball',
+            city='Bandung',
+            full_address='Jl. Cup',
+            entry_price=Decimal('50000'),
+            activities='Court',
+            organizer=cls.user,
+        )
+
+    def search(self, term):
+        model_admin = admin_site._registry[Event]
+        request = RequestFactory().get('/admin/Event/event/', {'q': term})
+        queryset, _ = model_admin.get_search_results(request, Event.objects.all(), term)
+        return set(queryset)
+
+    def test_short_term_matches_name_prefix_only(self):
+        """Test a short term matches only the start of the name"""
+        self.assertEqual(self.search('jak'), {self.cup})
+        self.assertEqual(self.search('ket'), set())
+
+    def test_long_term_matches_anywhere(self):
+        """Test a longer term falls back to icontains across search_fields"""
+        self.assertEqual(self.search('Basketball'), {self.cup})
+        self.assertEqual(self.search('Bandung'), {self.cup})
+
+
+class EventUrlTest(SimpleTestCase):
+    """Test Event URL names"""
+
+    CASES = [
+        ('event:event_list', {}, '/event/', views.event_list),
+        ('event:event_detail', {'pk': 1}, '/event/1/', views.event_detail),
+        ('event:add_event', {}, '/event/add/', views.add_event),
+        ('event:edit_event', {'pk': 1}, '/event/1/edit/', views.edit_event),
+        ('event:my_bookings', {}, '/event/my-bookings/', views.my_bookings),
+        ('event:ajax_search', {}, '/event/ajax/search/', views.ajax_search_events),
+        ('event:ajax_filter', {}, '/event/ajax/filter/', views.ajax_filter_sport),
+        ('event:ajax_delete', {'pk': 1}, '/event/1/ajax/delete/', views.ajax_delete_event),
+        ('event:ajax_join', {'pk': 1}, '/event/1/ajax/join/', views.ajax_join_event),
+        ('event:ajax_cancel', {'pk': 1}, '/event/1/ajax/cancel/', views.ajax_cancel_registration),
+        ('event:json_events', {}, '/event/json/', views.json_events),
+        ('event:json_event_detail', {'pk': 1}, '/event/json/1/', views.json_event_detail),
+    ]
+
+    def test_url_resolutions(self):
+        """Test URL names reverse to their paths and resolve to their views"""
+        for name, kwargs, expected, view in self.CASES:
+            with self.subTest(name=name):
+                self.assertEqual(reverse(name, kwargs=kwargs), expected)
+                self.assertEqual(resolve(expected).func, view)
+
+
 class EventListViewTest(TestCase):
     """Test event_list view"""
     
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_test_user()
+        
+        cls.event1, cls.event2 = Event.objects.bulk_create([
+            Event(
+                name='Tennis Event',
+                sport_type='tennis',
+                city='Jakarta',
+                full_address='Jl. Test 1',
+                entry_price=Decimal('100000'),
+                activities='Court',
+                status='available',
+                organizer=cls.user
+            ),
+            Event(
+                name='Basketball Event',
+                sport_type='basketball',
+                city='Bandung',
+                full_address='Jl. Test 2',
+                entry_price=Decimal('75000'),
+                activities='Court',
+                status='unavailable',
+                organizer=cls.user
+            ),
+        ])
+        cls.url = reverse('event:event_list')
+    
     def setUp(self):
         self.client = Client()
-        self.user = User.objects.create(
-            nama='testuser',
-            email='test@test.com',
-            kelamin='L',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456789',
-            password=make_password('testpass123')
-        )
-        
-        self.event1 = Event.objects.create(
-            name='Tennis Event',
-            sport_type='tennis',
-            city='Jakarta',
-            full_address='Jl. Test 1',
-            entry_price=Decimal('100000'),
-            activities='Court',
-            status='available',
-            organizer=self.user
-        )
-        
-        self.event2 = Event.objects.create(
-            name='Basketball Event',
-            sport_type='basketball',
-            city='Bandung',
-            full_address='Jl. Test 2',
-            entry_price=Decimal('75000'),
-            activities='Court',
-            status='unavailable',
-            organizer=self.user
-        )
     
     def test_event_list_view_get(self):
         """Test GET request to event list"""
-        response = self.client.get(reverse('event:event_list'))
+        # Anonymous visitor: one query for the events with their organizers
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Tennis Event')
         self.assertContains(response, 'Basketball Event')
     
-    def test_event_list_with_search(self):
-        """Test search functionality"""
-        response = self.client.get(reverse('event:event_list'), {'q': 'Tennis'})
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Tennis Event')
-    
-    def test_event_list_with_category_filter(self):
-        """Test category filter"""
-        response = self.client.get(reverse('event:event_list'), {'category': 'tennis'})
-        self.assertEqual(response.status_code, 200)
-    
-    def test_event_list_available_only(self):
-        """Test available only filter"""
-        response = self.client.get(reverse('event:event_list'), {'available_only': 'on'})
-        self.assertEqual(response.status_code, 200)
+    def test_event_list_filters(self):
+        """Test search, category and available-only filters"""
+        cases = [
+            ({'q': 'Tennis'}, ['Tennis Event']),
+            ({'category': 'basketball'}, ['Basketball Event']),
+            ({'available_only': 'on'}, ['Tennis Event']),
+        ]
+        for params, expected in cases:
+            with self.subTest(**params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual([e.name for e in response.context['events']], expected)
 
 
-class AjaxSearchEventsTest(TestCase):
+class AjaxSearchEventsTest(BaseEventTestCase):
     """Test ajax_search_events view"""
     
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse('event:ajax_search')
+    
     def setUp(self):
         self.client = Client()
-        self.user = User.objects.create(
-            nama='testuser',
-            email='test@test.com',
-            kelamin='L',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456789',
-            password=make_password('testpass123')
-        )
-        
-        self.event = Event.objects.create(
-            name='Test Event',
-            sport_type='tennis',
-            city='Jakarta',
-            full_address='Jl. Test',
-            entry_price=Decimal('100000'),
-            activities='Court',
-            organizer=self.user
-        )
     
-    def test_ajax_search(self):
-        """Test AJAX search endpoint"""
-        response = self.client.get(
-            reverse('event:ajax_search'),
-            {'search': 'Test', 'sport': 'All', 'available': 'false'}
-        )
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
-        self.assertTrue(data['success'])
-        self.assertGreater(data['count'], 0)
-    
-    def test_ajax_search_with_sport_filter(self):
-        """Test AJAX search with sport filter"""
-        response = self.client.get(
-            reverse('event:ajax_search'),
-            {'search': '', 'sport': 'tennis', 'available': 'false'}
-        )
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
-        self.assertTrue(data['success'])
+    def test_ajax_search_variants(self):
+        """Test AJAX search by keyword and by sport filter"""
+        cases = [
+            {'search': 'Test', 'sport': 'All', 'available': 'false'},
+            {'search': '', 'sport': 'tennis', 'available': 'false'},
+        ]
+        for params in cases:
+            # Organizers are joined, so each search is a single query
+            with self.subTest(params=params), self.assertNumQueries(1):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, 200)
+                data = response.json()
+                self.assertTrue(data['success'])
+                self.assertEqual(data['count'], 1)
 
 
 class AddEventViewTest(TestCase):
     """Test add_event view"""
     
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_test_user()
+        cls.session_key = create_user_session(cls.user)
+        cls.url = reverse('event:add_event')
+    
     def setUp(self):
         self.client = Client()
-        self.user = User.objects.create(
-            nama='testuser',
-            email='test@test.com',
-            kelamin='L',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456789',
-            password=make_password('testpass123')
-        )
-        # Set up session for custom_login_required
-        session = self.client.session
-        session['user_id'] = str(self.user.id)
-        session.save()
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
     
     def test_add_event_get(self):
         """Test GET request to add event"""
-        response = self.client.get(reverse('event:add_event'))
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertIsInstance(response.context['form'], EventForm)
     
     def test_add_event_post_valid(self):
         """Test POST with valid data"""
-        data = {
-            'name': 'New Event',
-            'sport_type': 'tennis',
-            'city': 'Jakarta',
-            'full_address': 'Jl. Test',
-            'entry_price': '100000',
-            'activities': 'Court',
-            'rating': '4.5',
-            'category': 'Competition',
-            'status': 'available'
-        }
-        response = self.client.post(reverse('event:add_event'), data)
-        self.assertEqual(Event.objects.count(), 1)
-        event = Event.objects.first()
+        response = self.client.post(self.url, EVENT_FORM_DATA)
+        # get() fails unless exactly one event was created
+        event = Event.objects.get()
         self.assertEqual(event.name, 'New Event')
+        self.assertEqual(event.organizer_id, self.user.id)
+        self.assertRedirects(response, f'/event/{event.id}/', fetch_redirect_response=False)
     
     def test_add_event_requires_login(self):
         """Test add event requires authentication"""
         self.client.session.flush()
-        response = self.client.get(reverse('event:add_event'))
-        self.assertEqual(response.status_code, 302)
+        response = self.client.get(self.url)
+        self.assertRedirects(response, '/login/', fetch_redirect_response=False)
 
 
-class EditEventViewTest(TestCase):
+class EditEventViewTest(BaseEventTestCase):
     """Test edit_event view"""
     
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.session_key = create_user_session(cls.user)
+        cls.url = reverse('event:edit_event', kwargs={'pk': cls.event.pk})
+    
     def setUp(self):
         self.client = Client()
-        self.user = User.objects.create(
-            nama='testuser',
-            email='test@test.com',
-            kelamin='L',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456789',
-            password=make_password('testpass123')
-        )
-        self.other_user = User.objects.create(
-            nama='otheruser',
-            email='other@test.com',
-            kelamin='P',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456788',
-            password=make_password('testpass123')
-        )
-        
-        self.event = Event.objects.create(
-            name='Test Event',
-            sport_type='tennis',
-            city='Jakarta',
-            full_address='Jl. Test',
-            entry_price=Decimal('100000'),
-            activities='Court',
-            organizer=self.user
-        )
-        
-        # Set up session
-        session = self.client.session
-        session['user_id'] = str(self.user.id)
-        session.save()
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
     
     def test_edit_event_get(self):
         """Test GET request to edit event"""
-        response = self.client.get(
-            reverse('event:edit_event', kwargs={'pk': self.event.pk})
-        )
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertIsInstance(response.context['form'], EventForm)
     
     def test_edit_event_post_valid(self):
         """Test POST with valid data"""
         data = {
+            **EVENT_FORM_DATA,
             'name': 'Updated Event',
             'sport_type': 'basketball',
             'city': 'Bandung',
-            'full_address': 'Jl. Updated',
-            'entry_price': '150000',
-            'activities': 'Court, Shower',
-            'rating': '4.8',
-            'category': 'Training',
-            'status': 'available'
         }
         response = self.client.post(
-            reverse('event:edit_event', kwargs={'pk': self.event.pk}),
+            self.url,
             data
         )
         self.event.refresh_from_db()
@@ -515,139 +649,85 @@ class EditEventViewTest(TestCase):
     
     def test_edit_event_wrong_organizer(self):
         """Test edit event by non-organizer"""
-        session = self.client.session
-        session['user_id'] = str(self.other_user.id)
-        session.save()
+        other_user = create_test_user(nama='otheruser', email='other@test.com')
+        login_as(self.client, other_user)
         
-        response = self.client.get(
-            reverse('event:edit_event', kwargs={'pk': self.event.pk})
-        )
+        response = self.client.get(self.url)
         self.assertEqual(response.status_code, 302)
 
 
-class DeleteEventViewTest(TestCase):
+class DeleteEventViewTest(BaseEventTestCase):
     """Test ajax_delete_event view"""
     
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.session_key = create_user_session(cls.user)
+        cls.url = reverse('event:ajax_delete', kwargs={'pk': cls.event.pk})
+    
     def setUp(self):
         self.client = Client()
-        self.user = User.objects.create(
-            nama='testuser',
-            email='test@test.com',
-            kelamin='L',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456789',
-            password=make_password('testpass123')
-        )
-        
-        self.event = Event.objects.create(
-            name='Test Event',
-            sport_type='tennis',
-            city='Jakarta',
-            full_address='Jl. Test',
-            entry_price=Decimal('100000'),
-            activities='Court',
-            organizer=self.user
-        )
-        
-        # Set up session
-        session = self.client.session
-        session['user_id'] = str(self.user.id)
-        session.save()
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
     
     def test_delete_event(self):
         """Test delete event"""
-        response = self.client.post(
-            reverse('event:ajax_delete', kwargs={'pk': self.event.pk})
-        )
+        response = self.client.post(self.url)
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertTrue(data['success'])
         self.assertEqual(Event.objects.count(), 0)
 
 
-class EventDetailViewTest(TestCase):
+class EventDetailViewTest(BaseEventTestCase):
     """Test event_detail view"""
     
-    def setUp(self):
-        self.client = Client()
-        self.user = User.objects.create(
-            nama='testuser',
-            email='test@test.com',
-            kelamin='L',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456789',
-            password=make_password('testpass123')
-        )
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         
-        self.event = Event.objects.create(
-            name='Test Event',
-            sport_type='tennis',
-            city='Jakarta',
-            full_address='Jl. Test',
-            entry_price=Decimal('100000'),
-            activities='Court',
-            organizer=self.user
-        )
-        
-        self.schedule = EventSchedule.objects.create(
-            event=self.event,
+        cls.schedule = EventSchedule.objects.create(
+            event=cls.event,
             date=date.today() + timedelta(days=7),
             is_available=True
         )
+        cls.url = reverse('event:event_detail', kwargs={'pk': cls.event.pk})
+    
+    def setUp(self):
+        self.client = Client()
     
     def test_event_detail_get(self):
         """Test GET request to event detail"""
-        response = self.client.get(
-            reverse('event:event_detail', kwargs={'pk': self.event.pk})
-        )
+        # Anonymous visitor: event joined with organizer, then its schedules
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context['event'], self.event)
     
     def test_event_detail_with_user_registered(self):
         """Test detail view when user is registered"""
-        session = self.client.session
-        session['user_id'] = str(self.user.id)
-        session.save()
+        login_as(self.client, self.user)
         
         EventRegistration.objects.create(
             event=self.event,
             user=self.user,
             schedule=self.schedule
         )
-        response = self.client.get(
-            reverse('event:event_detail', kwargs={'pk': self.event.pk})
-        )
+        response = self.client.get(self.url)
         self.assertTrue(response.context['user_registered'])
 
 
-class JoinEventViewTest(TestCase):
+class JoinEventViewTest(BaseEventTestCase):
     """Test ajax_join_event view"""
     
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.session_key = create_user_session(cls.user)
+        cls.url = reverse('event:ajax_join', kwargs={'pk': cls.event.pk})
+    
     def setUp(self):
         self.client = Client()
-        self.user = User.objects.create(
-            nama='testuser',
-            email='test@test.com',
-            kelamin='L',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456789',
-            password=make_password('testpass123')
-        )
-        
-        self.event = Event.objects.create(
-            name='Test Event',
-            sport_type='tennis',
-            city='Jakarta',
-            full_address='Jl. Test',
-            entry_price=Decimal('100000'),
-            activities='Court',
-            organizer=self.user
-        )
-        
-        # Set up session
-        session = self.client.session
-        session['user_id'] = str(self.user.id)
-        session.save()
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
     
     def test_join_event_success(self):
         """Test successful event join"""
@@ -663,14 +743,13 @@ class JoinEventViewTest(TestCase):
             'schedule_id': str(schedule.pk_event_sched)  # Use the UUID as string
         }
         
-        response = self.client.post(
-            reverse('event:ajax_join', kwargs={'pk': self.event.pk}),
-            json.dumps(data),
-            content_type='application/json'
+        response = self.post_json(
+            self.url,
+            data
         )
         
         self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.content)
+        response_data = response.json()
         self.assertTrue(response_data['success'])
         
         # Verify registration was created
@@ -684,10 +763,9 @@ class JoinEventViewTest(TestCase):
     
     def test_join_event_without_date(self):
         """Test join event without date"""
-        response = self.client.post(
-            reverse('event:ajax_join', kwargs={'pk': self.event.pk}),
-            json.dumps({}),
-            content_type='application/json'
+        response = self.post_json(
+            self.url,
+            {}
         )
         self.assertEqual(response.status_code, 400)
     
@@ -707,51 +785,32 @@ class JoinEventViewTest(TestCase):
         data = {
             'date': schedule.date.strftime('%m / %d / %Y')
         }
-        response = self.client.post(
-            reverse('event:ajax_join', kwargs={'pk': self.event.pk}),
-            json.dumps(data),
-            content_type='application/json'
+        response = self.post_json(
+            self.url,
+            data
         )
         self.assertEqual(response.status_code, 400)
 
 
-class ToggleAvailabilityViewTest(TestCase):
+class ToggleAvailabilityViewTest(BaseEventTestCase):
     """Test ajax_toggle_availability view"""
     
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.session_key = create_user_session(cls.user)
+        cls.url = reverse('event:ajax_toggle_availability', kwargs={'pk': cls.event.pk})
+    
     def setUp(self):
         self.client = Client()
-        self.user = User.objects.create(
-            nama='testuser',
-            email='test@test.com',
-            kelamin='L',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456789',
-            password=make_password('testpass123')
-        )
-        
-        self.event = Event.objects.create(
-            name='Test Event',
-            sport_type='tennis',
-            city='Jakarta',
-            full_address='Jl. Test',
-            entry_price=Decimal('100000'),
-            activities='Court',
-            status='available',
-            organizer=self.user
-        )
-        
-        # Set up session
-        session = self.client.session
-        session['user_id'] = str(self.user.id)
-        session.save()
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
     
     def test_toggle_to_unavailable(self):
         """Test toggling event to unavailable"""
         data = {'is_available': False}
-        response = self.client.post(
-            reverse('event:ajax_toggle_availability', kwargs={'pk': self.event.pk}),
-            json.dumps(data),
-            content_type='application/json'
+        response = self.post_json(
+            self.url,
+            data
         )
         self.assertEqual(response.status_code, 200)
         self.event.refresh_from_db()
@@ -763,144 +822,122 @@ class ToggleAvailabilityViewTest(TestCase):
         self.event.save()
         
         data = {'is_available': True}
-        response = self.client.post(
-            reverse('event:ajax_toggle_availability', kwargs={'pk': self.event.pk}),
-            json.dumps(data),
-            content_type='application/json'
+        response = self.post_json(
+            self.url,
+            data
         )
         self.assertEqual(response.status_code, 200)
         self.event.refresh_from_db()
         self.assertEqual(self.event.status, 'available')
 
 
-class GetSchedulesViewTest(TestCase):
+class GetSchedulesViewTest(BaseEventTestCase):
     """Test ajax_get_schedules view"""
     
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        
+        EventSchedule.objects.bulk_create([
+            EventSchedule(
+                event=cls.event,
+                date=date.today() + timedelta(days=7),
+                is_available=True
+            ),
+            EventSchedule(
+                event=cls.event,
+                date=date.today() + timedelta(days=14),
+                is_available=True
+            ),
+        ])
+    
     def setUp(self):
         self.client = Client()
-        self.user = User.objects.create(
-            nama='testuser',
-            email='test@test.com',
-            kelamin='L',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456789',
-            password=make_password('testpass123')
-        )
-        
-        self.event = Event.objects.create(
-            name='Test Event',
-            sport_type='tennis',
-            city='Jakarta',
-            full_address='Jl. Test',
-            entry_price=Decimal('100000'),
-            activities='Court',
-            organizer=self.user
-        )
-        
-        EventSchedule.objects.create(
-            event=self.event,
-            date=date.today() + timedelta(days=7),
-            is_available=True
-        )
-        EventSchedule.objects.create(
-            event=self.event,
-            date=date.today() + timedelta(days=14),
-            is_available=True
-        )
+        self.url = reverse('event:ajax_schedules', kwargs={'pk': self.event.pk})
+
+    def test_get_schedules_returns_upcoming_available(self):
+        """Test only available schedules from today onwards are returned"""
+        EventSchedule.objects.bulk_create([
+            EventSchedule(event=self.event, date=date.today() - timedelta(days=1), is_available=True),
+            EventSchedule(event=self.event, date=date.today() + timedelta(days=21), is_available=False),
+        ])
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertTrue(data['success'])
+        self.assertEqual(
+            sorted(schedule['date'] for schedule in data['schedules']),
+            [
+                (date.today() + timedelta(days=7)).strftime('%Y-%m-%d'),
+                (date.today() + timedelta(days=14)).strftime('%Y-%m-%d'),
+            ],
+        )
+        self.assertTrue(all(schedule['is_available'] for schedule in data['schedules']))
+
+    def test_get_schedules_unknown_event(self):
+        """Test an unknown event returns an empty schedule list"""
+        response = self.client.get(reverse('event:ajax_schedules', kwargs={'pk': 99999}))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['schedules'], [])
 
 
 class FilterSportViewTest(TestCase):
     """Test ajax_filter_sport view"""
     
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_test_user()
+        
+        Event.objects.bulk_create([
+            Event(
+                name='Tennis Event',
+                sport_type='tennis',
+                city='Jakarta',
+                full_address='Jl. Test 1',
+                entry_price=Decimal('100000'),
+                activities='Court',
+                organizer=cls.user
+            ),
+            Event(
+                name='Basketball Event',
+                sport_type='basketball',
+                city='Bandung',
+                full_address='Jl. Test 2',
+                entry_price=Decimal('75000'),
+                activities='Court',
+                organizer=cls.user
+            ),
+        ])
+    
     def setUp(self):
         self.client = Client()
-        self.user = User.objects.create(
-            nama='testuser',
-            email='test@test.com',
-            kelamin='L',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456789',
-            password=make_password('testpass123')
-        )
-        
-        Event.objects.create(
-            name='Tennis Event',
-            sport_type='tennis',
-            city='Jakarta',
-            full_address='Jl. Test 1',
-            entry_price=Decimal('100000'),
-            activities='Court',
-            organizer=self.user
-        )
-        
-        Event.objects.create(
-            name='Basketball Event',
-            sport_type='basketball',
-            city='Bandung',
-            full_address='Jl. Test 2',
-            entry_price=Decimal('75000'),
-            activities='Court',
-            organizer=self.user
-        )
-    
-    def test_filter_by_sport(self):
-        """Test filtering by sport type"""
-        response = self.client.get(
-            reverse('event:ajax_filter'),
-            {'sport': 'tennis'}
-        )
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
-        self.assertTrue(data['success'])
-        self.assertEqual(len(data['events']), 1)
-        self.assertEqual(data['events'][0]['sport_type'], 'tennis')
     
-    def test_filter_all_sports(self):
-        """Test filtering with 'All' option"""
-        response = self.client.get(
-            reverse('event:ajax_filter'),
-            {'sport': 'All'}
-        )
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
-        self.assertTrue(data['success'])
-        self.assertEqual(len(data['events']), 2)
+    def test_filter_sport_variants(self):
+        """Test filtering by one sport and with the 'All' option"""
+        cases = [
+            ('tennis', ['tennis']),
+            ('All', ['basketball', 'tennis']),
+        ]
+        for sport, expected in cases:
+            with self.subTest(sport=sport):
+                response = self.client.get(reverse('event:ajax_filter'), {'sport': sport})
+                self.assertEqual(response.status_code, 200)
+                data = response.json()
+                self.assertTrue(data['success'])
+                self.assertEqual(sorted(e['sport_type'] for e in data['events']), expected)
 
-class AdditionalEventViewTests(TestCase):
+class AdditionalEventViewTests(BaseEventTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.session_key = create_user_session(cls.user)
+    
     def setUp(self):
         self.client = Client()
-        self.user = User.objects.create(
-            nama='testuser',
-            email='test@test.com',
-            kelamin='L',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456789',
-            password=make_password('testpass123')
-        )
-        
-        self.other_user = User.objects.create(
-            nama='otheruser',
-            email='other@test.com',
-            kelamin='P',
-            tanggal_lahir='2000-01-01',
-            nomor_handphone='08123456788',
-            password=make_password('testpass123')
-        )
-        
-        # Set up session
-        session = self.client.session
-        session['user_id'] = str(self.user.id)
-        session.save()
-        
-        self.event = Event.objects.create(
-            name='Test Event',
-            sport_type='tennis',
-            city='Jakarta',
-            full_address='Jl. Test',
-            entry_price=Decimal('100000'),
-            activities='Court',
-            organizer=self.user
-        )
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
 
 
 class AddEventWithSchedulesTest(AdditionalEventViewTests):
@@ -915,16 +952,10 @@ class AddEventWithSchedulesTest(AdditionalEventViewTests):
         ]
         
         form_data = {
+            **EVENT_FORM_DATA,
             'name': 'Multi Schedule Event',
             'sport_type': 'basketball',
-            'city': 'Jakarta',
-            'full_address': 'Jl. Test',
-            'entry_price': '150000',
-            'activities': 'Court, Shower',
-            'rating': '4.5',
-            'category': 'Competition',
-            'status': 'available',
-            'schedule_dates': json.dumps(schedule_dates)
+            'schedule_dates': json.dumps(schedule_dates),
         }
         
         response = self.client.post(
@@ -934,30 +965,27 @@ class AddEventWithSchedulesTest(AdditionalEventViewTests):
         )
         
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertTrue(data['success'])
         
         # Verify schedules were created
-        new_event = Event.objects.get(name='Multi Schedule Event')
-        self.assertEqual(new_event.schedules.count(), 3)
+        self.assertEqual(
+            EventSchedule.objects.filter(event_id=data['event_id']).count(),
+            3
+        )
 
 
 class EditEventSchedulesTest(AdditionalEventViewTests):
     """Test edit event schedules"""
     
-    def setUp(self):
-        super().setUp()
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         # Create initial schedules
-        self.schedule1 = EventSchedule.objects.create(
-            event=self.event,
-            date=date.today() + timedelta(days=7),
-            is_available=True
-        )
-        self.schedule2 = EventSchedule.objects.create(
-            event=self.event,
-            date=date.today() + timedelta(days=14),
-            is_available=True
-        )
+        cls.schedule1, cls.schedule2 = EventSchedule.objects.bulk_create([
+            EventSchedule(event=cls.event, date=date.today() + timedelta(days=7), is_available=True),
+            EventSchedule(event=cls.event, date=date.today() + timedelta(days=14), is_available=True),
+        ])
     
     def test_edit_event_update_schedules(self):
         """Test updating event schedules"""
@@ -967,16 +995,9 @@ class EditEventSchedulesTest(AdditionalEventViewTests):
         ]
         
         form_data = {
+            **EVENT_FORM_DATA,
             'name': 'Updated Event',
-            'sport_type': 'tennis',
-            'city': 'Jakarta',
-            'full_address': 'Jl. Updated',
-            'entry_price': '200000',
-            'activities': 'Court',
-            'rating': '4.8',
-            'category': 'Training',
-            'status': 'available',
-            'schedule_dates[]': new_schedule_dates
+            'schedule_dates': json.dumps(new_schedule_dates),
         }
         
         response = self.client.post(
@@ -986,30 +1007,52 @@ class EditEventSchedulesTest(AdditionalEventViewTests):
         )
         
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertTrue(data['success'])
         
         # Old schedules should be deleted, new ones created
-        self.event.refresh_from_db()
-        self.assertEqual(self.event.schedules.count(), 2)
+        self.assertEqual(
+            sorted(d.strftime('%Y-%m-%d') for d in self.event.schedules.values_list('date', flat=True)),
+            new_schedule_dates,
+        )
+
+    def test_edit_event_without_schedule_dates_keeps_schedules(self):
+        """Test a request without schedule_dates leaves schedules untouched"""
+        response = self.client.post(
+            reverse('event:edit_event', kwargs={'pk': self.event.pk}),
+            {**EVENT_FORM_DATA, 'name': 'Updated Event'},
+            HTTP_X_REQUESTED_WITH='XMLHttpRequest'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+        self.assertEqual(
+            set(self.event.schedules.values_list('pk', flat=True)),
+            {self.schedule1.pk, self.schedule2.pk},
+        )
 
 
 class JoinEventAdvancedTest(AdditionalEventViewTests):
     """Advanced join event tests"""
     
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse('event:ajax_join', kwargs={'pk': cls.event.pk})
+    
     def test_join_event_with_invalid_schedule_id(self):
         """Test join event with invalid schedule ID"""
         data = {
             'schedule_id': 'invalid-uuid-string'
         }
         
-        response = self.client.post(
-            reverse('event:ajax_join', kwargs={'pk': self.event.pk}),
-            json.dumps(data),
-            content_type='application/json'
+        response = self.post_json(
+            self.url,
+            data
         )
         
-        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.json()['success'])
     
     def test_join_event_duplicate_registration(self):
         """Test joining same event schedule twice"""
@@ -1031,82 +1074,71 @@ class JoinEventAdvancedTest(AdditionalEventViewTests):
             'schedule_id': str(schedule.pk_event_sched)
         }
         
-        response = self.client.post(
-            reverse('event:ajax_join', kwargs={'pk': self.event.pk}),
-            json.dumps(data),
-            content_type='application/json'
+        response = self.post_json(
+            self.url,
+            data
         )
         
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertFalse(data['success'])
 
 
 class EventListAdvancedTest(AdditionalEventViewTests):
     """Advanced event list tests"""
     
-    def setUp(self):
-        super().setUp()
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         # Create multiple events
-        Event.objects.create(
-            name='Basketball Event',
-            sport_type='basketball',
-            city='Bandung',
-            full_address='Jl. Test 2',
-            entry_price=Decimal('75000'),
-            activities='Court',
-            status='available',
-            organizer=self.user
-        )
-        
-        Event.objects.create(
-            name='Soccer Event',
-            sport_type='soccer',
-            city='Jakarta',
-            full_address='Jl. Test 3',
-            entry_price=Decimal('50000'),
-            activities='Field',
-            status='unavailable',
-            organizer=self.user
-        )
-    
-    def test_event_list_with_search_query(self):
-        """Test event list with search query"""
-        response = self.client.get(
-            reverse('event:event_list'),
-            {'q': 'Basketball'}
-        )
-        
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Basketball Event')
-        self.assertNotContains(response, 'Soccer Event')
-    
-    def test_event_list_with_category_filter(self):
-        """Test event list with sport category filter"""
-        response = self.client.get(
-            reverse('event:event_list'),
-            {'category': 'basketball'}
-        )
-        
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Basketball Event')
-    
-    def test_event_list_available_only(self):
-        """Test event list showing only available events"""
-        response = self.client.get(
-            reverse('event:event_list'),
-            {'available_only': 'on'}
-        )
-        
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Basketball Event')
+        Event.objects.bulk_create([
+            Event(
+                name='Basketball Event',
+                sport_type='basketball',
+                city='Bandung',
+                full_address='Jl. Test 2',
+                entry_price=Decimal('75000'),
+                activities='Court',
+                status='available',
+                organizer=cls.user
+            ),
+            Event(
+                name='Soccer Event',
+                sport_type='soccer',
+                city='Jakarta',
+                full_address='Jl. Test 3',
+                entry_price=Decimal('50000'),
+                activities='Field',
+                status='unavailable',
+                organizer=cls.user
+            ),
+        ])
+        cls.url = reverse('event:event_list')
+    
+    def event_names(self, response):
+        """Names of the events the view passed to the template"""
+        return {event.name for event in response.context['events']}
+    
+    def test_event_list_filters(self):
+        """Test event list with search query, sport category and available-only filters"""
+        cases = [
+            ({'q': 'Basketball'}, {'Basketball Event'}),
+            ({'category': 'basketball'}, {'Basketball Event'}),
+            ({'available_only': 'on'}, {'Test Event', 'Basketball Event'}),
+        ]
+        for params, expected in cases:
+            with self.subTest(**params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(self.event_names(response), expected)
 
 
 class AjaxSearchAdvancedTest(AdditionalEventViewTests):
     """Advanced AJAX search tests"""
     
-    def setUp(self):
-        super().setUp()
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         Event.objects.create(
             name='Tennis Event 2',
             sport_type='tennis',
@@ -1115,13 +1147,14 @@ class AjaxSearchAdvancedTest(AdditionalEventViewTests):
             entry_price=Decimal('120000'),
             activities='Court',
             status='available',
-            organizer=self.user
+            organizer=cls.user
         )
+        cls.url = reverse('event:ajax_search')
     
     def test_ajax_search_with_all_filters(self):
         """Test AJAX search with all filter parameters"""
         response = self.client.get(
-            reverse('event:ajax_search'),
+            self.url,
             {
                 'search': 'Tennis',
                 'sport': 'tennis',
@@ -1130,19 +1163,19 @@ class AjaxSearchAdvancedTest(AdditionalEventViewTests):
         )
         
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertTrue(data['success'])
         self.assertGreaterEqual(data['count'], 1)  # At least one tennis event
     
     def test_ajax_search_with_no_results(self):
         """Test AJAX search with query that returns no results"""
         response = self.client.get(
-            reverse('event:ajax_search'),
+            self.url,
             {'search': 'NonexistentSport'}
         )
         
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertTrue(data['success'])
         self.assertEqual(data['count'], 0)
 
@@ -1150,34 +1183,31 @@ class AjaxSearchAdvancedTest(AdditionalEventViewTests):
 class EventDetailAdvancedTest(AdditionalEventViewTests):
     """Advanced event detail tests"""
     
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse('event:event_detail', kwargs={'pk': cls.event.pk})
+    
     def test_event_detail_without_user(self):
         """Test event detail page without logged in user"""
         # Clear session
         self.client.session.flush()
         
-        response = self.client.get(
-            reverse('event:event_detail', kwargs={'pk': self.event.pk})
-        )
+        response = self.client.get(self.url)
         
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context['user'], None)
     
     def test_event_detail_with_schedules(self):
         """Test event detail with multiple schedules"""
-        EventSchedule.objects.create(
-            event=self.event,
-            date=date.today() + timedelta(days=7),
-            is_available=True
-        )
-        EventSchedule.objects.create(
-            event=self.event,
-            date=date.today() + timedelta(days=14),
-            is_available=True
-        )
+        EventSchedule.objects.bulk_create([
+            EventSchedule(event=self.event, date=date.today() + timedelta(days=7), is_available=True),
+            EventSchedule(event=self.event, date=date.today() + timedelta(days=14), is_available=True),
+        ])
         
-        response = self.client.get(
-            reverse('event:event_detail', kwargs={'pk': self.event.pk})
-        )
+        # event + organizer, session, user, registration check, schedules
+        with self.assertNumQueries(5):
+            response = self.client.get(self.url)
         
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.context['schedules']), 2)
@@ -1186,6 +1216,11 @@ class EventDetailAdvancedTest(AdditionalEventViewTests):
 class MyBookingsTest(AdditionalEventViewTests):
     """Test my bookings page"""
     
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse('event:my_bookings')
+    
     def test_my_bookings_with_registrations(self):
         """Test my bookings page with user registrations"""
         schedule = EventSchedule.objects.create(
@@ -1200,7 +1235,9 @@ class MyBookingsTest(AdditionalEventViewTests):
             schedule=schedule
         )
         
-        response = self.client.get(reverse('event:my_bookings'))
+        # session, user, registrations joined with event/organizer/schedule
+        with self.assertNumQueries(3):
+            response = self.client.get(self.url)
         
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context['total_bookings'], 1)
@@ -1208,7 +1245,7 @@ class MyBookingsTest(AdditionalEventViewTests):
     
     def test_my_bookings_empty(self):
         """Test my bookings page with no registrations"""
-        response = self.client.get(reverse('event:my_bookings'))
+        response = self.client.get(self.url)
         
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context['total_bookings'], 0)
@@ -1217,14 +1254,19 @@ class MyBookingsTest(AdditionalEventViewTests):
         """Test my bookings requires authentication"""
         self.client.session.flush()
         
-        response = self.client.get(reverse('event:my_bookings'))
+        response = self.client.get(self.url)
         
-        self.assertEqual(response.status_code, 302)  # Redirect to login
+        self.assertRedirects(response, '/login/', fetch_redirect_response=False)
 
 
 class CancelRegistrationTest(AdditionalEventViewTests):
     """Test cancel registration"""
     
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse('event:ajax_cancel', kwargs={'pk': cls.event.pk})
+    
     def test_cancel_single_registration(self):
         """Test canceling a single registration"""
         schedule = EventSchedule.objects.create(
@@ -1239,69 +1281,58 @@ class CancelRegistrationTest(AdditionalEventViewTests):
             schedule=schedule
         )
         
-        response = self.client.post(
-            reverse('event:ajax_cancel', kwargs={'pk': self.event.pk})
-        )
+        response = self.client.post(self.url)
         
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertTrue(data['success'])
         
         # Verify registration was deleted
-        self.assertFalse(
+        self.assertEqual(
             EventRegistration.objects.filter(
                 event=self.event,
                 user=self.user
-            ).exists()
+            ).count(),
+            0
         )
     
     def test_cancel_multiple_registrations(self):
         """Test canceling multiple registrations"""
-        schedule1 = EventSchedule.objects.create(
-            event=self.event,
-            date=date.today() + timedelta(days=7),
-            is_available=True
-        )
-        schedule2 = EventSchedule.objects.create(
-            event=self.event,
-            date=date.today() + timedelta(days=14),
-            is_available=True
-        )
-        
-        EventRegistration.objects.create(
-            event=self.event,
-            user=self.user,
-            schedule=schedule1
-        )
-        EventRegistration.objects.create(
-            event=self.event,
-            user=self.user,
-            schedule=schedule2
-        )
-        
-        response = self.client.post(
-            reverse('event:ajax_cancel', kwargs={'pk': self.event.pk})
-        )
+        schedules = EventSchedule.objects.bulk_create([
+            EventSchedule(event=self.event, date=date.today() + timedelta(days=7), is_available=True),
+            EventSchedule(event=self.event, date=date.today() + timedelta(days=14), is_available=True),
+        ])
+        EventRegistration.objects.bulk_create([
+            EventRegistration(event=self.event, user=self.user, schedule=schedule)
+            for schedule in schedules
+        ])
+        
+        # session, user, event, then a single DELETE for both registrations
+        with self.assertNumQueries(4):
+            response = self.client.post(self.url)
         
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertTrue(data['success'])
         self.assertIn('2', data['message'])  # Should mention 2 registrations
     
     def test_cancel_no_registration(self):
         """Test canceling when no registration exists"""
-        response = self.client.post(
-            reverse('event:ajax_cancel', kwargs={'pk': self.event.pk})
-        )
+        response = self.client.post(self.url)
         
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertFalse(data['success'])
 
 
 class ToggleAvailabilityAdvancedTest(AdditionalEventViewTests):
     """Advanced toggle availability tests"""
     
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse('event:ajax_toggle_availability', kwargs={'pk': cls.event.pk})
+    
     def test_toggle_available_to_unavailable(self):
         """Test marking event as unavailable"""
         self.event.status = 'available'
@@ -1309,14 +1340,13 @@ class ToggleAvailabilityAdvancedTest(AdditionalEventViewTests):
         
         data = {'is_available': False}
         
-        response = self.client.post(
-            reverse('event:ajax_toggle_availability', kwargs={'pk': self.event.pk}),
-            json.dumps(data),
-            content_type='application/json'
+        response = self.post_json(
+            self.url,
+            data
         )
         
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertTrue(data['success'])
         
         self.event.refresh_from_db()
@@ -1326,29 +1356,25 @@ class ToggleAvailabilityAdvancedTest(AdditionalEventViewTests):
         """Test toggle with invalid boolean value"""
         data = {'is_available': 'invalid'}
         
-        response = self.client.post(
-            reverse('event:ajax_toggle_availability', kwargs={'pk': self.event.pk}),
-            json.dumps(data),
-            content_type='application/json'
+        response = self.post_json(
+            self.url,
+            data
         )
         
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
+        data = response.json()
         self.assertFalse(data['success'])
     
     def test_toggle_non_organizer(self):
         """Test toggle by non-organizer (should fail in decorator)"""
-        # Login as other user
-        session = self.client.session
-        session['user_id'] = str(self.other_user.id)
-        session.save()
+        other_user = create_test_user(nama='otheruser', email='other@test.com')
+        login_as(self.client, other_user)
         
         data = {'is_available': True}
         
-        response = self.client.post(
-            reverse('event:ajax_toggle_availability', kwargs={'pk': self.event.pk}),
-            json.dumps(data),
-            content_type='application/json'
+        response = self.post_json(
+            self.url,
+            data
         )
         
         # This will pass through decorator but we can verify organizer check
@@ -1359,8 +1385,9 @@ class ToggleAvailabilityAdvancedTest(AdditionalEventViewTests):
 class AjaxFilterSportAdvancedTest(AdditionalEventViewTests):
     """Advanced filter sport tests"""
     
-    def setUp(self):
-        super().setUp()
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         Event.objects.create(
             name='Basketball Event',
             sport_type='basketball',
@@ -1368,30 +1395,58 @@ class AjaxFilterSportAdvancedTest(AdditionalEventViewTests):
             full_address='Jl. Test',
             entry_price=Decimal('100000'),
             activities='Court',
-            organizer=self.user
-        )
-    
-    def test_filter_sport_specific(self):
-        """Test filtering by specific sport"""
-        response = self.client.get(
-            reverse('event:ajax_filter'),
-            {'sport': 'basketball'}
+            organizer=cls.user
         )
-        
-        self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
-        self.assertTrue(data['success'])
-        self.assertEqual(len(data['events']), 1)
-        self.assertEqual(data['events'][0]['sport_type'], 'basketball')
+        cls.url = reverse('event:ajax_filter')
     
-    def test_filter_sport_all(self):
-        """Test filtering with 'All' option"""
-        response = self.client.get(
-            reverse('event:ajax_filter'),
-            {'sport': 'All'}
-        )
-        
+    def test_filter_sport_cases(self):
+        """Test filtering by a specific sport and with the 'All' option"""
+        cases = [
+            ('basketball', ['basketball']),
+            ('All', ['basketball', 'tennis']),
+        ]
+        for sport, expected in cases:
+            with self.subTest(sport=sport):
+                response = self.client.get(self.url, {'sport': sport})
+                self.assertEqual(response.status_code, 200)
+                data = response.json()
+                self.assertTrue(data['success'])
+                self.assertEqual(sorted(e['sport_type'] for e in data['events']), expected)
+
+class JsonEventChoicesTest(AdditionalEventViewTests):
+    """Test sport_type/status validation in the Flutter JSON endpoints"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.create_url = reverse('event:json_create')
+        cls.edit_url = reverse('event:json_edit', kwargs={'pk': cls.event.pk})
+
+    def test_create_normalises_choices(self):
+        """Test labels and mixed case are stored as the choice codes"""
+        response = self.post_json(self.create_url, {
+            **EVENT_FORM_DATA,
+            'sport_type': 'Table Tennis',
+            'status': 'Unavailable',
+        })
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.content)
-        self.assertTrue(data['success'])
-        self.assertGreaterEqual(len(data['events']), 2)
\ No newline at end of file
+        event = Event.objects.get(pk=response.json()['event_id'])
+        self.assertEqual(event.sport_type, Event.SportType.TABLE_TENNIS)
+        self.assertEqual(event.status, Event.Status.UNAVAILABLE)
+
+    def test_unknown_choices_rejected(self):
+        """Test unknown sport_type/status values get a 400 and change nothing"""
+        cases = [
+            (self.create_url, {**EVENT_FORM_DATA, 'sport_type': 'underwater hockey'}),
+            (self.create_url, {**EVENT_FORM_DATA, 'status': 'maybe'}),
+            (self.edit_url, {'sport_type': 'x' * 50}),
+            (self.edit_url, {'status': 'maybe'}),
+        ]
+        for url, payload in cases:
+            with self.subTest(url=url, payload=payload):
+                response = self.post_json(url, payload)
+                self.assertEqual(response.status_code, 400)
+                self.assertFalse(response.json()['success'])
+        self.assertEqual(Event.objects.count(), 1)
+        self.event.refresh_from_db()
+        self.assertEqual((self.event.sport_type, self.event.status), ('tennis', 'available'))
@@ -2,12 +2,14 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.http import require_GET
+from django.views.decorators.csrf import csrf_exempt
 from django.db.models import Q, Min
-from datetime import datetime, date
+from datetime import datetime
 import json
+import uuid
 
 from .models import Event, EventSchedule, EventRegistration
-from .forms import EventForm, CITY_CHOICES, canonical_city
+from .forms import EventForm, CITY_CHOICES, canonical_city, canonical_sport_type, canonical_status
 
 # ==================== CUSTOM LOGIN DECORATOR ====================
 def custom_login_required(view_func):
@@ -60,7 +62,7 @@ def event_list(request):
     except:
         request.user = None
 
-    events = Event.objects.annotate(
+    events = Event.objects.for_listing().card_fields().annotate(
         next_schedule_date=Min(
             'schedules__date',
             filter=Q(
@@ -81,11 +83,12 @@ def event_list(request):
             | Q(sport_type__icontains=query)
         )
 
+    # Stored choice values are lowercase, so exact lookups can use the index
     if selected_category and selected_category.lower() != "all":
-        events = events.filter(sport_type__iexact=selected_category)
+        events = events.filter(sport_type=selected_category.lower())
 
     if available_only:
-        events = events.filter(status__iexact="Available")
+        events = events.filter(status=Event.Status.AVAILABLE)
 
     events = events.order_by("-created_at")
 
@@ -128,7 +131,7 @@ def ajax_search_events(request):
         sport_filter = request.GET.get('sport', 'All')
         show_available = request.GET.get('available', 'false') == 'true'
         
-        events = Event.objects.all()
+        events = Event.objects.for_listing().card_fields()
         
         if sport_filter != 'All':
             events = events.filter(sport_type=sport_filter)
@@ -154,7 +157,7 @@ def ajax_search_events(request):
                 'rating': str(event.rating),
                 'entry_price': str(event.entry_price),
                 'status': event.status,
-                'photo_url': event.photo.url if event.photo else '/static/images/default-event.jpg',
+                'photo_url': event.photo_url or '/static/images/default-event.jpg',
                 'organizer': organizer_name,
                 'full_address': event.full_address,
                 'is_organizer': request.user and request.user.id == event.organizer.id if request.user else False,
@@ -190,22 +193,16 @@ def add_event(request):
             
             try:
                 schedule_dates = json.loads(schedule_dates_json)
-                
-                # Create EventSchedule objects for each date
+                new_dates = set()
                 for date_str in schedule_dates:
                     try:
                         # Parse date string (format: YYYY-MM-DD)
-                        date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
-                        
-                        # Create or get schedule
-                        EventSchedule.objects.get_or_create(
-                            event=event,
-                            date=date_obj,
-                            defaults={'is_available': True}
-                        )
-                            
+                        new_dates.add(datetime.strptime(date_str, '%Y-%m-%d').date())
                     except ValueError:
                         continue
+
+                # Create all EventSchedule rows in one INSERT
+                EventSchedule.objects.add_dates(event, new_dates)
                         
             except json.JSONDecodeError:
                 pass
@@ -255,29 +252,22 @@ def edit_event(request, pk):
 
             event.save()
 
-            # Update schedules from JSON list
-            schedule_dates_json = request.POST.get('schedule_dates', '[]')
-            try:
-                schedule_dates = json.loads(schedule_dates_json)
-                new_dates = set()
-                for date_str in schedule_dates:
-                    try:
-                        new_dates.add(datetime.strptime(date_str, '%Y-%m-%d').date())
-                    except ValueError:
-                        continue
-
-                # Remove schedules not in new list
-                EventSchedule.objects.filter(event=event).exclude(date__in=new_dates).delete()
-
-                # Add or keep schedules in new list
-                for d in new_dates:
-                    EventSchedule.objects.get_or_create(
-                        event=event,
-                        date=d,
-                        defaults={'is_available': True}
-                    )
-            except json.JSONDecodeError:
-                pass
+            # Update schedules from JSON list. A request without the field
+            # leaves the existing schedules alone instead of wiping them.
+            if 'schedule_dates' in request.POST:
+                try:
+                    schedule_dates = json.loads(request.POST['schedule_dates'])
+                    new_dates = set()
+                    for date_str in schedule_dates:
+                        try:
+                            new_dates.add(datetime.strptime(date_str, '%Y-%m-%d').date())
+                        except ValueError:
+                            continue
+
+                    # Remove schedules not in new list, add the missing ones
+                    EventSchedule.objects.sync_dates(event, new_dates)
+                except json.JSONDecodeError:
+                    pass
             
             if is_ajax:
                 return JsonResponse({
@@ -326,7 +316,8 @@ def ajax_delete_event(request, pk):
 
 # ==================== EVENT DETAIL ====================
 def event_detail(request, pk):
-    event = get_object_or_404(Event, pk=pk)
+    # Organizer is shown on the page; join it instead of a second lookup
+    event = get_object_or_404(Event.objects.select_related('organizer'), pk=pk)
     
     try:
         from Auth_Profile.models import User
@@ -334,11 +325,12 @@ def event_detail(request, pk):
     except:
         user = None
     
+    # The date picker only needs each schedule's id and date
     schedules = EventSchedule.objects.filter(
         event=event, 
         is_available=True, 
         date__gte=datetime.now().date()
-    ).order_by('date')
+    ).only('pk_event_sched', 'date').order_by('date')
     
     user_registered = False
     user_registrations = []
@@ -355,7 +347,7 @@ def event_detail(request, pk):
         'user_registered': user_registered,
         'user_registrations': user_registrations,
         'organizer': event.organizer,
-        'activities': getattr(event, 'get_activities_list', lambda: [])(),
+        'activities': event.activities_list,
         'user': user
     }
     return render(request, 'event/event_detail.html', context)
@@ -370,6 +362,12 @@ def ajax_join_event(request, pk):
         
         if not schedule_id:
             return JsonResponse({'success': False, 'message': 'Please select a date'}, status=400)
+
+        # Reject malformed ids before they reach the UUID lookup
+        try:
+            schedule_id = uuid.UUID(str(schedule_id))
+        except ValueError:
+            return JsonResponse({'success': False, 'message': 'Invalid schedule'}, status=400)
         
         event = get_object_or_404(Event, pk=pk)
         schedule = get_object_or_404(EventSchedule, pk_event_sched=schedule_id, event=event)
@@ -394,15 +392,13 @@ def ajax_cancel_registration(request, pk):
         event = get_object_or_404(Event, pk=pk)
         
         # Find user's registration for this event
-        registrations = EventRegistration.objects.filter(event=event, user=request.user)
+        # Delete all registrations (in case user registered for multiple schedules);
+        # delete() reports how many rows went, so no separate exists()/count() query
+        count, _ = EventRegistration.objects.filter(event=event, user=request.user).delete()
         
-        if not registrations.exists():
+        if not count:
             return JsonResponse({'success': False, 'message': 'No registration found'}, status=400)
         
-        # Delete all registrations (in case user registered for multiple schedules)
-        count = registrations.count()
-        registrations.delete()
-        
         return JsonResponse({
             'success': True, 
             'message': f'Successfully cancelled {count} registration(s)!',
@@ -449,10 +445,9 @@ def ajax_filter_sport(request):
         request.user = None
 
     sport = request.GET.get('sport', 'All')
-    if sport == 'All':
-        events = Event.objects.all()
-    else:
-        events = Event.objects.filter(sport_type=sport)
+    events = Event.objects.for_listing().card_fields()
+    if sport != 'All':
+        events = events.filter(sport_type=sport)
 
     events_data = []
     for event in events:
@@ -465,7 +460,7 @@ def ajax_filter_sport(request):
             'rating': str(event.rating),
             'entry_price': str(event.entry_price),
             'status': event.status,
-            'photo_url': event.photo.url if event.photo else '/static/images/default-event.jpg',
+            'photo_url': event.photo_url or '/static/images/default-event.jpg',
             'organizer': organizer_name,
             'full_address': event.full_address,
             'is_organizer': request.user and request.user.id == event.organizer.id if request.user else False,
@@ -550,9 +545,6 @@ def my_bookings(request):
     return render(request, 'event/my_bookings.html', context)
 
 # ==================== JSON ENDPOINTS FOR FLUTTER ====================
-from django.http import JsonResponse
-from django.views.decorators.csrf import csrf_exempt
-import json
 
 @require_GET
 def json_event_cities(request):
@@ -572,7 +564,7 @@ def json_events(request):
         except:
             user = None
         
-        events = Event.objects.all()
+        events = Event.objects.for_listing()
         
         # Get user registered events
         user_registered = []
@@ -592,7 +584,7 @@ def json_events(request):
                 'entry_price': str(event.entry_price),
                 'activities': event.activities or '',
                 'rating': str(event.rating),
-                'photo_url': event.photo.url if event.photo else '',
+                'photo_url': event.photo_url,
                 'status': event.status,
                 'category': event.category,
                 'organizer_id': event.organizer.id,
@@ -653,7 +645,7 @@ def json_event_detail(request, pk):
             'entry_price': str(event.entry_price),
             'activities': event.activities or '',
             'rating': str(event.rating),
-            'photo_url': event.photo.url if event.photo else '',
+            'photo_url': event.photo_url,
             'status': event.status,
             'category': event.category,
             'organizer_id': event.organizer.id,
@@ -684,11 +676,19 @@ def json_create_event(request):
         city = canonical_city(data.get('city'))
         if not city:
             return JsonResponse({'success': False, 'message': 'Invalid city'}, status=400)
+
+        sport_type = canonical_sport_type(data.get('sport_type'))
+        if not sport_type:
+            return JsonResponse({'success': False, 'message': 'Invalid sport type'}, status=400)
+
+        status = canonical_status(data.get('status', Event.Status.AVAILABLE))
+        if not status:
+            return JsonResponse({'success': False, 'message': 'Invalid status'}, status=400)
         
         # Create event
         event = Event.objects.create(
             name=data['name'],
-            sport_type=data['sport_type'],
+            sport_type=sport_type,
             description=data.get('description', ''),
             city=city,
             full_address=data['full_address'],
@@ -697,22 +697,19 @@ def json_create_event(request):
             rating=data.get('rating', 0),
             google_maps_link=data.get('google_maps_link', ''),
             category=data.get('category', 'category 1'),
-            status=data.get('status', 'available'),
+            status=status,
             organizer=request.user
         )
         
         # Create schedules if provided
         if 'schedule_dates' in data:
+            new_dates = set()
             for date_str in data['schedule_dates']:
                 try:
-                    date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
-                    EventSchedule.objects.get_or_create(
-                        event=event,
-                        date=date_obj,
-                        defaults={'is_available': True}
-                    )
+                    new_dates.add(datetime.strptime(date_str, '%Y-%m-%d').date())
                 except ValueError:
                     continue
+            EventSchedule.objects.add_dates(event, new_dates)
         
         return JsonResponse({
             'success': True,
@@ -735,6 +732,12 @@ def json_join_event(request, pk):
         
         if not schedule_id:
             return JsonResponse({'success': False, 'message': 'Please select a date'}, status=400)
+
+        # Reject malformed ids before they reach the UUID lookup
+        try:
+            schedule_id = uuid.UUID(str(schedule_id))
+        except ValueError:
+            return JsonResponse({'success': False, 'message': 'Invalid schedule'}, status=400)
         
         event = get_object_or_404(Event, pk=pk)
         schedule = get_object_or_404(EventSchedule, pk_event_sched=schedule_id, event=event)
@@ -766,14 +769,11 @@ def json_cancel_event(request, pk):
     
     try:
         event = get_object_or_404(Event, pk=pk)
-        registrations = EventRegistration.objects.filter(event=event, user=request.user)
+        count, _ = EventRegistration.objects.filter(event=event, user=request.user).delete()
         
-        if not registrations.exists():
+        if not count:
             return JsonResponse({'success': False, 'message': 'No registration found'}, status=400)
         
-        count = registrations.count()
-        registrations.delete()
-        
         return JsonResponse({
             'success': True,
             'message': f'Successfully cancelled {count} registration(s)!'
@@ -865,10 +865,21 @@ def json_edit_event(request, pk):
             if not city:
                 return JsonResponse({'success': False, 'message': 'Invalid city'}, status=400)
             event.city = city
+
+        if 'sport_type' in data:
+            sport_type = canonical_sport_type(data.get('sport_type'))
+            if not sport_type:
+                return JsonResponse({'success': False, 'message': 'Invalid sport type'}, status=400)
+            event.sport_type = sport_type
+
+        if 'status' in data:
+            status = canonical_status(data.get('status'))
+            if not status:
+                return JsonResponse({'success': False, 'message': 'Invalid status'}, status=400)
+            event.status = status
         
         # Update event fields
         event.name = data.get('name', event.name)
-        event.sport_type = data.get('sport_type', event.sport_type)
         event.description = data.get('description', event.description)
         event.full_address = data.get('full_address', event.full_address)
         event.entry_price = data.get('entry_price', event.entry_price)
@@ -876,7 +887,6 @@ def json_edit_event(request, pk):
         event.rating = data.get('rating', event.rating)
         event.google_maps_link = data.get('google_maps_link', event.google_maps_link)
         event.category = data.get('category', event.category)
-        event.status = data.get('status', event.status)
         
         event.save()
         
@@ -892,16 +902,8 @@ def json_edit_event(request, pk):
                 except ValueError:
                     continue
             
-            # Remove schedules not in new list
-            EventSchedule.objects.filter(event=event).exclude(date__in=new_dates).delete()
-            
-            # Add or keep schedules in new list
-            for d in new_dates:
-                EventSchedule.objects.get_or_create(
-                    event=event,
-                    date=d,
-                    defaults={'is_available': True}
-                )
+            # Remove schedules not in new list, add the missing ones
+            EventSchedule.objects.sync_dates(event, new_dates)
         
         return JsonResponse({
             'success': True,
@@ -0,0 +1,43 @@
+"""
+Settings for running the test suite.
+
+`manage.py test` picks this module automatically; everything not
+overridden here comes from root_project.settings.
+"""
+
+import atexit
+import shutil
+import tempfile
+
+from .settings import *  # noqa: F401,F403
+
+# Tests never rely on password strength; PBKDF2's iterations only slow
+# down every fixture that calls make_password().
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+TEST_RUNNER = 'root_project.test_runner.ParallelTestRunner'
+
+# Tests always run on SQLite, even with PRODUCTION set, so no test
+# touches the shared PostgreSQL server. The schema lives in a file so
+# --keepdb can reuse it between runs (an in-memory test database has
+# nothing to keep), and the PRAGMAs skip fsync and keep the rollback
+# journal in memory, so per-test writes stay memory-speed. A crash can
+# only corrupt the throwaway test database; a run without --keepdb
+# rebuilds it.
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'db.sqlite3',  # noqa: F405
+        'OPTIONS': {
+            'init_command': 'PRAGMA synchronous = OFF; PRAGMA journal_mode = MEMORY',
+        },
+        'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},  # noqa: F405
+    }
+}
+
+# Uploads made by tests (coach images, event photos) go to a throwaway
+# directory instead of the repository's media/.
+MEDIA_ROOT = tempfile.mkdtemp(prefix='movebuddy-test-media-')
+atexit.register(shutil.rmtree, MEDIA_ROOT, ignore_errors=True)
@@ -0,0 +1,45 @@
+from django.test.runner import DiscoverRunner
+from django.test.utils import setup_databases as _setup_databases
+
+
+class ParallelTestRunner(DiscoverRunner):
+    """DiscoverRunner that runs test classes in parallel by default.
+
+    Pass --keepdb to reuse the test database between local runs; only
+    unapplied migrations then run on it. Leave it off after editing an
+    existing migration, since a kept schema would not pick that up.
+
+    Test classes are spread over one worker per CPU by default; set
+    DJANGO_TEST_PROCESSES or pass --parallel N to cap the worker count.
+    """
+
+    @classmethod
+    def add_arguments(cls, parser):
+        super().add_arguments(parser)
+        parser.set_defaults(parallel='auto')
+
+    def setup_databases(self, **kwargs):
+        if not (self.keepdb and self.parallel > 1):
+            return super().setup_databases(**kwargs)
+        # With keepdb, Django would also reuse existing worker clones as-is
+        # and miss migrations applied to the main test database since. Set
+        # up the main databases without clones, then clone each one once
+        # from the migrated copy.
+        old_config = _setup_databases(
+            self.verbosity,
+            self.interactive,
+            time_keeper=self.time_keeper,
+            keepdb=True,
+            debug_sql=self.debug_sql,
+            parallel=0,
+            **kwargs,
+        )
+        for connection, _, is_first in old_config:
+            if not is_first:
+                continue
+            for index in range(self.parallel):
+                with self.time_keeper.timed("  Cloning '%s'" % connection.alias):
+                    connection.creation.clone_test_db(
+                        suffix=str(index + 1), verbosity=self.verbosity, keepdb=False,
+                    )
+        return old_config